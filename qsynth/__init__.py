@@ -1,8 +1,27 @@
 """Qsynth - Programmatic synthetic data generation."""
-from qsynth.models import Model, Schema, Attribute, RowSpec
-from qsynth.main import MultiModelsFaker, Experiments
-from qsynth.experiments import get_experiment_class, register_experiment
-from qsynth.writers import get_writer, register_writer
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from qsynth.models import Model, Schema, Attribute, RowSpec
+    from qsynth.main import MultiModelsFaker, Experiments
+    from qsynth.experiments import get_experiment_class, register_experiment
+    from qsynth.writers import get_writer, register_writer
+
+# Public names are resolved on first access so that importing a submodule
+# (e.g. qsynth.repl or qsynth.models) does not pull in pandas and Faker.
+_EXPORTS = {
+    'Model': 'qsynth.models',
+    'Schema': 'qsynth.models',
+    'Attribute': 'qsynth.models',
+    'RowSpec': 'qsynth.models',
+    'MultiModelsFaker': 'qsynth.main',
+    'Experiments': 'qsynth.main',
+    'get_experiment_class': 'qsynth.experiments',
+    'register_experiment': 'qsynth.experiments',
+    'get_writer': 'qsynth.writers',
+    'register_writer': 'qsynth.writers',
+}
 
 __all__ = [
     # Core classes
@@ -21,3 +40,13 @@ __all__ = [
 
 __version__ = '0.1.0'
 
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Importing experiments registers all experiment types and their writers
+    _importlib.import_module('qsynth.experiments')
+    value = getattr(_importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,8 +1,11 @@
 import argparse
+import functools
 
 from qsynth import main as _main
 
 
+# Parser construction is deterministic; build it once and share it (parse_args does not mutate it)
+@functools.lru_cache(maxsize=1)
 def argument_parser():
     argp = argparse.ArgumentParser(prog="qsynth")
     subparsers = argp.add_subparsers(dest='command')
@@ -67,7 +70,7 @@ def exec_show_schema(args):
         try:
             import yaml
             with open(args.yaml_file, 'r') as yamlstream:
-                mp = yaml.safe_load(yamlstream)
+                mp = _main.load_yaml(yamlstream)
             
             _main.list_schema_content(args.yaml_file, mp)
             
@@ -95,8 +98,8 @@ def exec_preview(args):
     _main.preview_data(args.yaml_file, model_name=args.model, schema_name=args.schema, rows=args.rows)
 
 
-def exec_cli():
-    parsed = argument_parser().parse_args()
+def exec_cli(argv=None):
+    parsed = argument_parser().parse_args(argv)
     if parsed.command == 'types':
         exec_types(parsed)
     elif parsed.command == 'run':
@@ -0,0 +1,34 @@
+"""Configuration file parsing, kept free of pandas and Faker so the REPL can load it cheaply."""
+import copy
+import functools
+import json
+import os
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml(stream):
+    """Parse YAML safely, using the libyaml loader when available."""
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(p, mtime_ns, size):
+    """Parse a config file; the stat fields key the cache so edited files are re-read."""
+    with open(p, 'r') as stream:
+        # JSON configs skip the YAML parser; everything else is YAML
+        return json.load(stream) if Path(p).suffix.lower() == '.json' else load_yaml(stream)
+
+
+def load_config_file(p):
+    """Return the parsed config mapping, reusing the parse while the file is unchanged."""
+    st = os.stat(p)
+    # Callers keep references into the mapping, so each one gets its own copy
+    return copy.deepcopy(_parse_config_file(str(p), st.st_mtime_ns, st.st_size))
@@ -1,16 +1,23 @@
 """Experiments package for qsynth - modular experiment types."""
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Type
 from qsynth.experiments.base import Experiment
 
 
 # Registry for experiment types
 _EXPERIMENT_REGISTRY: Dict[str, Type[Experiment]] = {}
+# Read-only live view of the registry for bulk lookups
+EXPERIMENT_REGISTRY: Mapping[str, Type[Experiment]] = MappingProxyType(_EXPERIMENT_REGISTRY)
+# Sorted registered type names; rebuilt on the next listing after a registration
+_TYPES_CACHE: Optional[Tuple[str, ...]] = None
 
 
 def register_experiment(experiment_type: str):
     """Decorator to register an experiment class."""
     def decorator(cls: Type[Experiment]):
+        global _TYPES_CACHE
         _EXPERIMENT_REGISTRY[experiment_type] = cls
+        _TYPES_CACHE = None
         return cls
     return decorator
 
@@ -23,9 +30,12 @@ def get_experiment_class(experiment_type: str) -> Type[Experiment]:
     return cls
 
 
-def list_experiment_types() -> list[str]:
+def list_experiment_types() -> Tuple[str, ...]:
     """List all registered experiment types."""
-    return sorted(_EXPERIMENT_REGISTRY.keys())
+    global _TYPES_CACHE
+    if _TYPES_CACHE is None:
+        _TYPES_CACHE = tuple(sorted(_EXPERIMENT_REGISTRY))
+    return _TYPES_CACHE
 
 
 # Import all experiment modules to trigger registration
@@ -46,6 +56,7 @@ from qsynth.experiments.base import Experiment  # noqa: E402
 
 __all__ = [
     'Experiment',
+    'EXPERIMENT_REGISTRY',
     'register_experiment',
     'get_experiment_class',
     'list_experiment_types',
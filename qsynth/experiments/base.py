@@ -1,4 +1,6 @@
 """Base experiment class and configuration."""
+import functools
+import string
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type
@@ -7,6 +9,32 @@ from pydantic import BaseModel, Field
 from qsynth.models import Model
 
 
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_path_template(path_template: str):
+    """Parse a path template once into a renderer taking the variables mapping."""
+    parts = list(string.Formatter().parse(path_template))
+    # Positional, attribute/index and nested-spec fields keep the full str.format semantics
+    if any(field is not None and (not field or field.isdigit() or '.' in field or '[' in field
+                                  or '{' in (spec or ''))
+           for _, field, spec, _ in parts):
+        return lambda kwargs: path_template.format(**kwargs)
+
+    def render(kwargs):
+        out = []
+        for literal, field, spec, conversion in parts:
+            out.append(literal)
+            if field is not None:
+                value = kwargs[field]
+                if conversion:
+                    value = _CONVERSIONS[conversion](value)
+                out.append(format(value, spec))
+        return ''.join(out)
+    return render
+
+
 class ExperimentConfig(BaseModel):
     """Base configuration for all experiments."""
     type: str = Field(description="Experiment type identifier")
@@ -38,6 +66,6 @@ class Experiment(ABC):
     
     def _resolve_path(self, path_template: str, **kwargs) -> Path:
         """Resolve path template with variables."""
-        resolved = path_template.format(**kwargs)
+        resolved = _compile_path_template(path_template)(kwargs)
         return (self.relative_to / resolved).absolute()
 
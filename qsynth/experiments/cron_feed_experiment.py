@@ -10,7 +10,7 @@ from qsynth.experiments.base import Experiment
 from qsynth.experiments import register_experiment
 from qsynth.models import Model
 from qsynth.main import MultiModelsFaker
-from qsynth.writers import get_writer
+from qsynth.writers import get_writer, write_all
 
 
 @register_experiment('cron_feed')
@@ -49,7 +49,14 @@ class CronFeedExperiment(Experiment):
         writer = get_writer(self.writer_config['name'])
         write_params = self.writer_config.get('params', {})
         
-        # Generate data for each cron occurrence
+        writer.init_writer((self.relative_to / Path(self.path_template).parent).absolute())
+        try:
+            self._run_ticks(writer, write_params, from_date, to_date, count)
+        finally:
+            writer.finalize_writer()
+    
+    def _run_ticks(self, writer, write_params, from_date, to_date, count) -> None:
+        """Generate and write data for each cron occurrence in the date range."""
         i = 0
         cron_iter = croniter(self.cron, from_date)
         cur_date = from_date
@@ -63,6 +70,7 @@ class CronFeedExperiment(Experiment):
             mmf.generate_all()
             
             # Write each dataset
+            tasks = []
             for model_name, model_faker in mmf.models.items():
                 for dataset_name, dataframe in model_faker.generated.items():
                     path_vars = {
@@ -71,7 +79,8 @@ class CronFeedExperiment(Experiment):
                         'cron-date': cur_date
                     }
                     output_path = self._resolve_path(self.path_template, **path_vars)
-                    writer.write(output_path, dataframe, model_name, dataset_name, model_faker, write_params)
+                    tasks.append((writer, output_path, dataframe, model_name, dataset_name, model_faker, write_params))
+            write_all(tasks)
             
             i += 1
 
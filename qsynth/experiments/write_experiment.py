@@ -6,6 +6,7 @@ from abc import abstractmethod
 from qsynth.experiments.base import Experiment
 from qsynth.models import Model
 from qsynth.main import MultiModelsFaker
+from qsynth.writers import write_all
 from qsynth.writers.base import Writer
 
 
@@ -48,6 +49,7 @@ class WriteExperiment(Experiment):
         writer.init_writer(init_path)
         
         # Write each generated dataset
+        tasks = []
         for model_name, model_faker in mmf.models.items():
             for dataset_name, dataframe in model_faker.generated.items():
                 path_vars = {
@@ -55,9 +57,11 @@ class WriteExperiment(Experiment):
                     'dataset-name': dataset_name
                 }
                 output_path = self._resolve_path(self.path_template, **path_vars)
-                writer.write(output_path, dataframe, model_name, dataset_name, model_faker, self.write_params)
-        
-        writer.finalize_writer()
+                tasks.append((writer, output_path, dataframe, model_name, dataset_name, model_faker, self.write_params))
+        try:
+            write_all(tasks)
+        finally:
+            writer.finalize_writer()
     
     @abstractmethod
     def get_writer(self) -> Writer:
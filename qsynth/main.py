@@ -1,4 +1,5 @@
 import argparse
+import functools
 import sys
 import inspect
 
@@ -17,8 +18,9 @@ from pathlib import Path
 from collections import namedtuple
 import pandas as pd
 from pandas import DataFrame
+from qsynth.config import load_yaml, load_config_file
 from qsynth.provider import QsynthProviders
-from qsynth.models import Model, Schema, Attribute, RowSpec
+from qsynth.models import Model, Schema, Attribute, RowSpec, parse_models
 from typing import List
 import re
 from rich.console import Console
@@ -40,6 +42,12 @@ def create_faker(**kwargs):
     return faker
 
 
+@functools.lru_cache(maxsize=None)
+def faker_for_locale(locale):
+    """Return a shared Faker for the locale, built once per process."""
+    return create_faker(locale=locale)
+
+
 
 
 AttributeG = namedtuple("AttributeG", "key gen params")
@@ -48,11 +56,8 @@ AttributeG = namedtuple("AttributeG", "key gen params")
 class MultiModelsFaker:
 
     def __init__(self, models):
-        self.models = {}
-        for m in models:
-            # Parse dict to Pydantic model
-            model_obj = Model(**m) if isinstance(m, dict) else m
-            self.models.update({model_obj.name: MultiModelsFaker.ModelFaker(model_obj)})
+        # Dicts are validated to Pydantic models in one batch; Model instances pass through
+        self.models = {m.name: MultiModelsFaker.ModelFaker(m) for m in parse_models(models)}
 
     def explain(self):
         print(self.models)
@@ -66,10 +71,15 @@ class MultiModelsFaker:
             self.model: Model = model
             self.generated = {}
 
+        @functools.cached_property
+        def schemas_by_name(self):
+            """Model schemas keyed by name; the first schema wins on duplicate names."""
+            return {schema.name: schema for schema in reversed(self.model.schemas)}
+
         def generate(self):
             self.generated = {}
             locale = self.model.locales if isinstance(self.model.locales, str) else self.model.locales[0]
-            faker = create_faker(locale=locale)
+            faker = faker_for_locale(locale)
             for schema in self.model.schemas:
                 r = self.__generate_schema(faker, schema)
                 key = schema.name
@@ -82,11 +92,13 @@ class MultiModelsFaker:
                     raise ValueError(f"${ref} type requires params.dataset and params.attribute")
                 ds = attr.params.dataset
                 col = attr.params.attribute
-                pd = self.generated[ds]
+                values = self.generated[ds][col].to_numpy()
 
                 def g(*args, **kwargs):
-                    return random.choice(list(pd[col].values))
+                    return random.choice(values)
 
+                # Lets __generate_schema draw the whole column at once
+                g.ref_values = values
                 return g
             elif hasattr(f, gn):
                 g = getattr(f, gn)
@@ -115,6 +127,15 @@ class MultiModelsFaker:
             else:
                 raise ValueError(f"Unsupported row spec type: {type(rowobj)}")
 
+            # Draw ${ref} columns in one vectorized pass, seeded from the faker's RNG
+            # so generation stays reproducible under Faker seeding
+            for i, g in enumerate(gens):
+                ref_values = getattr(g.gen, 'ref_values', None)
+                if ref_values is not None and len(ref_values) and rowstogen:
+                    rng = numpy.random.default_rng(fake.random.getrandbits(64))
+                    drawn = ref_values[rng.integers(len(ref_values), size=rowstogen)]
+                    gens[i] = g._replace(gen=iter(drawn).__next__, params={})
+
             for index in range(1, rowstogen + 1):
                 row = [g.gen(**g.params) for g in gens]
                 rows.append(row)
@@ -139,8 +160,8 @@ class MultiModelsFaker:
 
 def from_model_file(p):
     with open(p, 'r') as yamlstream:
-        mp = yaml.safe_load(yamlstream)
-        models = [Model(**m) for m in mp['models']]
+        mp = load_yaml(yamlstream)
+        models = parse_models(mp['models'])
         return MultiModelsFaker(models)
 
 
@@ -182,11 +203,14 @@ class Experiments:
         experiment.run()
 
 
+def load_dict(mp, relative_to=None):
+    """Build experiments from an already parsed configuration mapping."""
+    models = parse_models(mp['models'])
+    return Experiments(mp['experiments'], models, relative_to=relative_to)
+
+
 def load(p):
-    with open(p, 'r') as yamlstream:
-        mp = yaml.safe_load(yamlstream)
-        models = [Model(**m) for m in mp['models']]
-        return Experiments(mp['experiments'], models, relative_to=p)
+    return load_dict(load_config_file(p), relative_to=p)
 
 
 def run_experiments(path, *args):
@@ -324,14 +348,14 @@ def show_schema_info(yaml_file, model_name=None, schema_name=None):
     try:
         # Load and parse YAML file
         with open(yaml_file, 'r') as yamlstream:
-            mp = yaml.safe_load(yamlstream)
+            mp = load_yaml(yamlstream)
         
         if 'models' not in mp:
             console.print(f"\n[bold red]Error:[/bold red] No 'models' section found in YAML file.")
             return
         
         # Parse models
-        models = [Model(**m) for m in mp['models']]
+        models = parse_models(mp['models'])
         
         # Filter by model name if specified
         if model_name:
@@ -470,14 +494,14 @@ def preview_data(yaml_file, model_name=None, schema_name=None, rows=10):
     try:
         # Load and parse YAML file
         with open(yaml_file, 'r') as yamlstream:
-            mp = yaml.safe_load(yamlstream)
+            mp = load_yaml(yamlstream)
         
         if 'models' not in mp:
             console.print(f"\n[bold red]Error:[/bold red] No 'models' section found in YAML file.")
             return
         
         # Parse models
-        models = [Model(**m) for m in mp['models']]
+        models = parse_models(mp['models'])
         
         # Filter by model name if specified
         if model_name:
@@ -530,8 +554,8 @@ def preview_data(yaml_file, model_name=None, schema_name=None, rows=10):
                     table.add_column(col, style="cyan", no_wrap=False, overflow="fold")
                 
                 # Add rows
-                for _, row in preview_df.iterrows():
-                    table.add_row(*[str(val) for val in row])
+                for row in preview_df.itertuples(index=False, name=None):
+                    table.add_row(*map(str, row))
                 
                 console.print(table)
                 console.print()
@@ -552,7 +576,7 @@ def describe_experiments(yaml_file):
     """Describe experiments configuration from a YAML file."""
     try:
         with open(yaml_file, 'r') as yamlstream:
-            mp = yaml.safe_load(yamlstream)
+            mp = load_yaml(yamlstream)
         
         if 'experiments' not in mp or not mp['experiments']:
             console.print(f"\n[bold yellow]No experiments defined in:[/bold yellow] [yellow]{yaml_file}[/yellow]\n")
@@ -609,6 +633,8 @@ def describe_experiments(yaml_file):
         console.print(f"\n[bold red]Error:[/bold red] {e}")
 
 
+# Parser construction is deterministic; build it once and share it (parse_args does not mutate it)
+@functools.lru_cache(maxsize=1)
 def argument_parser():
     argp = argparse.ArgumentParser(prog="qsynth")
     subparsers = argp.add_subparsers(dest='command')
@@ -671,7 +697,7 @@ def exec_show_schema(args):
     if not args.model and not args.schema:
         try:
             with open(args.yaml_file, 'r') as yamlstream:
-                mp = yaml.safe_load(yamlstream)
+                mp = load_yaml(yamlstream)
             
             list_schema_content(args.yaml_file, mp)
             
@@ -699,8 +725,8 @@ def exec_preview(args):
     preview_data(args.yaml_file, model_name=args.model, schema_name=args.schema, rows=args.rows)
 
 
-def exec_cli():
-    parsed = argument_parser().parse_args()
+def exec_cli(argv=None):
+    parsed = argument_parser().parse_args(argv)
     if parsed.command == 'types':
         exec_types(parsed)
     elif parsed.command == 'run':
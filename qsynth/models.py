@@ -1,6 +1,6 @@
 """Strictly typed Pydantic models for qsynth configuration schemas."""
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
 
 class RowSpec(BaseModel):
@@ -60,7 +60,7 @@ class Attribute(BaseModel):
         if v is None:
             return None
         if isinstance(v, dict):
-            return AttributeParams(**v)
+            return AttributeParams.model_validate(v)
         return v
 
 
@@ -77,7 +77,7 @@ class Schema(BaseModel):
         if isinstance(v, int):
             return v
         if isinstance(v, dict):
-            return RowSpec(**v)
+            return RowSpec.model_validate(v)
         raise ValueError(f"rows must be int or dict with min/max, got {type(v)}")
 
 
@@ -98,6 +98,15 @@ class Model(BaseModel):
         return v
 
 
+# Built once; validates a whole models list in a single pydantic-core call
+_MODELS_ADAPTER = TypeAdapter(List[Model])
+
+
+def parse_models(items) -> List[Model]:
+    """Validate a list of model dicts (or Model instances) in one batch."""
+    return _MODELS_ADAPTER.validate_python(list(items))
+
+
 class ExperimentConfig(BaseModel):
     """Base experiment configuration."""
     type: str = Field(description="Experiment type")
@@ -1,21 +1,170 @@
 """REPL shell for interactive qsynth usage."""
+import bisect
+import functools
+import itertools
 import shlex
+import traceback
+import types
+import typing
 from pathlib import Path
-from typing import Optional, List
-import yaml
-import inspect
+from typing import Iterator, Optional, Tuple
 
-from qsynth import main as _main
-from qsynth.models import Model
+from qsynth.config import load_config_file
+from qsynth.models import parse_models
+
+
+# Completion candidates (ordered) and their membership sets
+_PREVIEW_FLAGS = ('--rows', '-r')
+_PREVIEW_FLAG_SET = frozenset(_PREVIEW_FLAGS)
+_TYPE_FLAGS = ('--all', '--find')
+_DESCRIBE_TARGETS = ('model', 'schema', 'experiments')
+_NO_ARG_COMMANDS = frozenset({'models', 'experiments', 'exps', 'list', 'ls', 'help', 'clear', 'exit', 'quit'})
+
+# Shortest filter for which faker types are also matched by substring
+_MIN_SUBSTRING_FILTER = 2
+
+# Characters that make a string value need quoting in generated YAML
+_YAML_SPECIALS = frozenset(' :#&*?|-<>=!%@`')
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_faker():
+    """Create the Faker instance shared by completion and the test command."""
+    from qsynth import main as _main
+    return _main.create_faker()
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_faker_providers() -> Tuple[str, ...]:
+    """Discover all callable Faker provider types once per process."""
+    names = set()
+    # Query provider classes rather than the Faker proxy: no per-attribute
+    # locale routing, no descriptor binding, and no generator plumbing methods
+    for provider in _shared_faker().providers:
+        provider_cls = type(provider)
+        for attr in dir(provider_cls):
+            if not attr.startswith('_') and callable(getattr(provider_cls, attr, None)):
+                names.add(attr)
+    return tuple(sorted(names))
+
+
+@functools.lru_cache(maxsize=512)
+def _method_parameters(func) -> Tuple[tuple, tuple]:
+    """Return required (name, type_str, annotation) and optional (name, type_str, annotation, default) tuples."""
+    import inspect
+    empty = inspect.Parameter.empty
+    required = []
+    optional = []
+    for param_name, param in inspect.signature(func).parameters.items():
+        if param_name == 'self':
+            continue
+        annotation = param.annotation
+        type_str = '-' if annotation is empty else getattr(annotation, '__name__', str(annotation))
+        if param.default is empty:
+            required.append((param_name, type_str, annotation))
+        else:
+            optional.append((param_name, type_str, annotation, param.default))
+    return tuple(required), tuple(optional)
+
+
+@functools.singledispatch
+def _yaml_value(value) -> str:
+    """Format a Python value as a YAML scalar or flow sequence."""
+    return str(value)
+
+
+@_yaml_value.register(bool)
+def _(value) -> str:
+    return 'true' if value else 'false'
+
+
+@_yaml_value.register(str)
+def _(value) -> str:
+    # Quote strings that might need quoting
+    if not _YAML_SPECIALS.isdisjoint(value):
+        return f'"{value}"'
+    return value
+
+
+@_yaml_value.register(list)
+def _(value) -> str:
+    return f"[{', '.join(map(_yaml_value, value))}]"
+
+
+@_yaml_value.register(type(None))
+def _(value) -> str:
+    return "null"
+
+
+def _parse_bool(value_str: str) -> bool:
+    """Parse a boolean entered at the prompt."""
+    return value_str.lower() in ('true', '1', 'yes', 'on')
+
+
+def _infer_value(value_str: str):
+    """Parse an untyped value as int, then float, else keep the string."""
+    # Plain decimal numbers are classified up front instead of raising and catching ValueError
+    body = value_str[1:] if value_str[:1] in ('-', '+') else value_str
+    if body.isascii():
+        if body.isdigit():
+            return int(value_str)
+        if body.count('.') == 1 and body.replace('.', '', 1).isdigit():
+            return float(value_str)
+    # Other spellings (1_000, padded, exponents) are left to int() and float()
+    try:
+        if '.' not in value_str:
+            return int(value_str)
+        return float(value_str)
+    except ValueError:
+        return value_str
+
+
+# Prompt value parsers keyed by annotation type
+_TYPE_PARSERS = {int: int, float: float, bool: _parse_bool, str: str}
+# typing.Union plus PEP 604 unions (X | Y) where available
+_UNION_ORIGINS = frozenset(filter(None, (typing.Union, getattr(types, 'UnionType', None))))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_annotation_str(annotation) -> str:
+    return str(annotation)
+
+
+def _annotation_str(annotation) -> str:
+    """Return str(annotation), memoized for hashable annotations."""
+    try:
+        return _cached_annotation_str(annotation)
+    except TypeError:
+        # Unhashable annotation object
+        return str(annotation)
+
+
+class _TrieNode:
+    """Node of the prefix trie used to complete faker type names."""
+    __slots__ = ('children', 'names')
+
+    def __init__(self):
+        self.children = {}
+        self.names = []  # Indices of all names passing through this node
 
 
 class QsynthCompleter:
     """Auto-completion completer for qsynth REPL commands."""
     
-    def __init__(self, repl_instance):
+    def __init__(self, repl_instance, max_results: int = 50):
         """Initialize completer with reference to REPL instance."""
         self.repl = repl_instance
+        self.max_results = max_results  # Cap for completions from large lists (faker types, experiments)
+        
+        self._commands = (
+            'help', 'list', 'ls', 'models', 'schemas', 'experiments', 'exps',
+            'describe', 'run', 'preview', 'types', 'info', 'test', 'clear', 'exit', 'quit'
+        )
+        
+        self._last_lower = ('', '')  # Last (word, lowercased word), reused while the word is unchanged
         self._faker_types = None  # Cache for faker types
+        self._lower_names = None  # Lowercased faker types, parallel to _faker_types
+        self._prefix_trie = None  # Prefix trie over _lower_names
     
     async def get_completions_async(self, document, complete_event):
         """Async version of get_completions."""
@@ -23,156 +172,208 @@ class QsynthCompleter:
         for completion in self.get_completions(document, complete_event):
             yield completion
     
-    def _get_faker_types(self) -> List[str]:
-        """Get list of all available Faker provider types."""
+    # Models and experiments never change after loading, so the completion tables
+    # are built once - on first use, which is also when the REPL config is loaded
+    
+    @functools.cached_property
+    def _model_names(self) -> Tuple[str, ...]:
+        """Model names in configuration order."""
+        return tuple(model.name for model in self.repl.models)
+    
+    @functools.cached_property
+    def _experiment_names(self) -> Tuple[str, ...]:
+        """Sorted experiment names."""
+        return tuple(sorted(self.repl.experiments))
+    
+    @functools.cached_property
+    def _exp_names_by_lower(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Parallel (lowercase, original) experiment name tuples ordered by lowercase name, for bisect."""
+        experiments_by_lower = sorted((name.lower(), name) for name in self.repl.experiments)
+        return (tuple(lower for lower, _ in experiments_by_lower),
+                tuple(name for _, name in experiments_by_lower))
+    
+    @functools.cached_property
+    def _schemas_by_model(self) -> dict:
+        """Sorted unique schema names per model."""
+        return {
+            model.name: tuple(sorted({schema.name for schema in model.schemas}))
+            for model in self.repl.models
+        }
+    
+    @functools.cached_property
+    def _all_schemas(self) -> Tuple[str, ...]:
+        """Sorted unique schema names across all models."""
+        return tuple(sorted({
+            schema for schemas in self._schemas_by_model.values() for schema in schemas
+        }))
+    
+    def _get_faker_types(self) -> Tuple[str, ...]:
+        """Get all available Faker provider types."""
         if self._faker_types is None:
-            faker = _main.create_faker()
-            providers = []
-            for attr in dir(faker):
-                if attr.startswith('_'):
-                    continue
-                try:
-                    # Safely check if attribute is callable
-                    obj = getattr(faker, attr, None)
-                    if obj is not None and callable(obj):
-                        providers.append(attr)
-                except (TypeError, AttributeError):
-                    # Skip attributes that raise errors when accessed
-                    continue
-            self._faker_types = sorted(providers)
+            self._faker_types = _discover_faker_providers()
+            self._lower_names = tuple(name.lower() for name in self._faker_types)
+            self._prefix_trie = self._build_trie(self._lower_names)
         return self._faker_types
     
-    def _get_commands(self) -> List[str]:
-        """Get list of all available commands."""
-        return [
-            'help', 'list', 'ls', 'models', 'schemas', 'experiments', 'exps',
-            'describe', 'run', 'preview', 'types', 'info', 'test', 'clear', 'exit', 'quit'
-        ]
-    
-    def _get_model_names(self) -> List[str]:
-        """Get list of all model names."""
-        return [model.name for model in self.repl.models]
-    
-    def _get_schema_names(self, model_name: Optional[str] = None) -> List[str]:
-        """Get list of schema names, optionally filtered by model."""
-        schemas = []
-        for model in self.repl.models:
-            if model_name is None or model.name == model_name:
-                schemas.extend([schema.name for schema in model.schemas])
-        return sorted(set(schemas))
-    
-    def _get_experiment_names(self) -> List[str]:
-        """Get list of all experiment names."""
-        return sorted(self.repl.experiments.keys())
-    
-    def _matches_filter(self, candidate: str, filter_text: str) -> bool:
-        """Check if candidate matches filter text (case-insensitive, supports partial match)."""
-        if not filter_text:
-            return True
-        candidate_lower = candidate.lower()
-        filter_lower = filter_text.lower()
-        # Support both prefix matching (preferred) and substring matching
-        return candidate_lower.startswith(filter_lower) or filter_lower in candidate_lower
-    
-    def _get_completion_priority(self, candidate: str, filter_text: str) -> int:
-        """Return priority for completion (lower = higher priority)."""
-        if not filter_text:
-            return 1
-        candidate_lower = candidate.lower()
-        filter_lower = filter_text.lower()
-        if candidate_lower.startswith(filter_lower):
-            return 0  # Prefix match has highest priority
-        elif filter_lower in candidate_lower:
-            return 1  # Substring match has lower priority
-        return 2
+    @staticmethod
+    def _build_trie(names) -> _TrieNode:
+        """Build a prefix trie where every node lists the indices of names below it."""
+        root = _TrieNode()
+        for index, name in enumerate(names):
+            node = root
+            node.names.append(index)
+            for ch in name:
+                child = node.children.get(ch)
+                if child is None:
+                    child = node.children[ch] = _TrieNode()
+                node = child
+                node.names.append(index)
+        return root
+    
+    def _match_faker_types(self, filter_lower: str):
+        """Yield faker types matching a lowercased filter: prefix matches via the trie, else substring matches."""
+        faker_types = self._get_faker_types()
+        
+        node = self._prefix_trie
+        for ch in filter_lower:
+            node = node.children.get(ch)
+            if node is None:
+                break
+        
+        if node is not None:
+            for index in node.names:
+                yield faker_types[index]
+            return
+        
+        # No prefix match - fall back to substring search, unless the filter is a
+        # single character that would match most of the list
+        if len(filter_lower) >= _MIN_SUBSTRING_FILTER:
+            yield from self._rank(faker_types, self._lower_names, filter_lower)
+    
+    def _get_commands(self) -> Tuple[str, ...]:
+        """Get all available commands."""
+        return self._commands
+    
+    def _get_model_names(self) -> Tuple[str, ...]:
+        """Get all model names."""
+        return self._model_names
+    
+    def _get_schema_names(self, model_name: Optional[str] = None) -> Tuple[str, ...]:
+        """Get sorted schema names, optionally filtered by model."""
+        if model_name is None:
+            return self._all_schemas
+        return self._schemas_by_model.get(model_name, ())
+    
+    def _get_experiment_names(self) -> Tuple[str, ...]:
+        """Get sorted experiment names."""
+        return self._experiment_names
+    
+    def _match_experiments(self, filter_lower: str):
+        """Yield experiment names matching a lowercased filter: prefix matches via bisect, else substring matches."""
+        names_lower, names_original = self._exp_names_by_lower
+        
+        index = bisect.bisect_left(names_lower, filter_lower)
+        start = index
+        while index < len(names_lower) and names_lower[index].startswith(filter_lower):
+            yield names_original[index]
+            index += 1
+        if index > start:
+            return
+        
+        # No prefix match - fall back to substring search
+        yield from self._rank(names_original, names_lower, filter_lower)
+    
+    @staticmethod
+    def _rank(candidates, candidates_lower, filter_lower: str) -> Iterator[str]:
+        """Yield prefix matches as found, then substring matches (case-insensitive)."""
+        substring_matches = None  # Allocated only once a substring-only match turns up
+        for name, name_lower in zip(candidates, candidates_lower):
+            if name_lower.startswith(filter_lower):
+                yield name
+            elif filter_lower in name_lower:
+                if substring_matches is None:
+                    substring_matches = []
+                substring_matches.append(name)
+        if substring_matches:
+            yield from substring_matches
+    
+    def _ranked(self, candidates, filter_lower: str) -> Iterator[str]:
+        """Yield candidates matching a lowercased filter, prefix matches first."""
+        return self._rank(candidates, map(str.lower, candidates), filter_lower)
     
     def get_completions(self, document, complete_event):
         """Get completions for the current input with incremental search support."""
         from prompt_toolkit.completion import Completion
         
+        # Per-keystroke state, computed once for all branches
         text = document.text_before_cursor
-        words = []
-        
-        # Try to parse words, handling quoted strings
-        try:
-            words = shlex.split(text) if text.strip() else []
-        except ValueError:
-            # If parsing fails (unclosed quote), return empty
-            return
-        
-        # If we're in the middle of a quoted string, don't complete
-        if text.count('"') % 2 == 1 or text.count("'") % 2 == 1:
-            return
+        text_ends_space = text.endswith(' ')
+        current_word = document.get_word_before_cursor(WORD=True) or ""
+        last_word, current_word_lower = self._last_lower
+        if current_word != last_word:
+            current_word_lower = current_word.lower()
+            self._last_lower = (current_word, current_word_lower)
+        start_position = -len(current_word)
+        
+        if '"' not in text and "'" not in text and '\\' not in text:
+            # Fast path: without quotes or escapes shlex splitting equals whitespace splitting
+            words = text.split()
+        else:
+            # Try to parse words, handling quoted strings
+            try:
+                words = shlex.split(text) if text.strip() else []
+            except ValueError:
+                # If parsing fails (unclosed quote), return empty
+                return
+            
+            # If we're in the middle of a quoted string, don't complete
+            if text.count('"') % 2 == 1 or text.count("'") % 2 == 1:
+                return
         
         # First word - command completion
-        if len(words) == 0 or (len(words) == 1 and not text.endswith(' ')):
-            word_before_cursor = document.get_word_before_cursor(WORD=True)
-            if not word_before_cursor:
-                word_before_cursor = ""
-            commands = self._get_commands()
-            # Sort by priority (prefix matches first, then substring matches)
-            matching_commands = [
-                (cmd, self._get_completion_priority(cmd, word_before_cursor))
-                for cmd in commands
-                if self._matches_filter(cmd, word_before_cursor)
-            ]
-            matching_commands.sort(key=lambda x: x[1])  # Sort by priority
-            for cmd, _ in matching_commands:
-                yield Completion(cmd, start_position=-len(word_before_cursor))
+        if len(words) == 0 or (len(words) == 1 and not text_ends_space):
+            # Prefix matches first, then substring matches
+            for cmd in self._ranked(self._get_commands(), current_word_lower):
+                yield Completion(cmd, start_position=start_position)
             return
         
         command = words[0].lower()
-        current_word = document.get_word_before_cursor(WORD=True)
-        if not current_word:
-            current_word = ""
         
         # Check if we're at a new argument position
-        is_new_arg = text.endswith(' ') or len(words) > 1
+        is_new_arg = text_ends_space
         
         # Command-specific completions
         if command == 'schemas':
             # schemas [model_name]
             if len(words) == 2 or (len(words) == 1 and is_new_arg):
-                for model in self._get_model_names():
-                    if self._matches_filter(model, current_word):
-                        yield Completion(model, start_position=-len(current_word))
+                for model in self._ranked(self._get_model_names(), current_word_lower):
+                    yield Completion(model, start_position=start_position)
         
         elif command == 'describe':
             # describe [model|schema|experiments] [name]
             if len(words) == 1 or (len(words) == 2 and not is_new_arg):
                 # Complete: model, schema, experiments
-                options = ['model', 'schema', 'experiments']
-                for opt in options:
-                    if self._matches_filter(opt, current_word):
-                        yield Completion(opt, start_position=-len(current_word))
+                for opt in self._ranked(_DESCRIBE_TARGETS, current_word_lower):
+                    yield Completion(opt, start_position=start_position)
             
             elif len(words) == 2 and words[1].lower() == 'model':
                 # describe model [model_name]
                 if is_new_arg or len(words) == 3:
-                    for model in self._get_model_names():
-                        if self._matches_filter(model, current_word):
-                            yield Completion(model, start_position=-len(current_word))
+                    for model in self._ranked(self._get_model_names(), current_word_lower):
+                        yield Completion(model, start_position=start_position)
             
             elif len(words) == 2 and words[1].lower() == 'schema':
                 # describe schema [schema_name]
                 if is_new_arg or len(words) == 3:
-                    for schema in self._get_schema_names():
-                        if self._matches_filter(schema, current_word):
-                            yield Completion(schema, start_position=-len(current_word))
+                    for schema in self._ranked(self._get_schema_names(), current_word_lower):
+                        yield Completion(schema, start_position=start_position)
         
         elif command == 'run':
             # run [experiment1] [experiment2] ...
             if len(words) >= 1:
-                experiments = self._get_experiment_names()
-                # Sort by priority (prefix matches first)
-                matching_exps = [
-                    (exp, self._get_completion_priority(exp, current_word))
-                    for exp in experiments
-                    if self._matches_filter(exp, current_word)
-                ]
-                matching_exps.sort(key=lambda x: x[1])
-                for exp, _ in matching_exps:
-                    yield Completion(exp, start_position=-len(current_word))
+                # Prefix matches come from a bisect over the sorted names
+                for exp in itertools.islice(self._match_experiments(current_word_lower), self.max_results):
+                    yield Completion(exp, start_position=start_position)
         
         elif command == 'preview':
             # preview [model] [schema] or preview --rows [number]
@@ -183,10 +384,10 @@ class QsynthCompleter:
             
             # Parse arguments to understand context
             while i < len(words):
-                if words[i] in ['--rows', '-r']:
+                if words[i] in _PREVIEW_FLAG_SET:
                     in_rows_flag = True
                     break
-                elif not model_found and words[i] not in ['--rows', '-r']:
+                elif not model_found:
                     model_found = True
                     i += 1
                 elif model_found and not schema_found:
@@ -197,77 +398,46 @@ class QsynthCompleter:
             
             if not model_found and not in_rows_flag:
                 # Complete model names or flags
-                flags = ['--rows', '-r']
-                for flag in flags:
-                    if self._matches_filter(flag, current_word):
-                        yield Completion(flag, start_position=-len(current_word))
+                for flag in self._ranked(_PREVIEW_FLAGS, current_word_lower):
+                    yield Completion(flag, start_position=start_position)
                 
-                for model in self._get_model_names():
-                    if self._matches_filter(model, current_word):
-                        yield Completion(model, start_position=-len(current_word))
+                for model in self._ranked(self._get_model_names(), current_word_lower):
+                    yield Completion(model, start_position=start_position)
             
             elif model_found and not schema_found and not in_rows_flag:
                 # Complete schema names for the model
                 model_name = words[1] if len(words) > 1 else None
-                for schema in self._get_schema_names(model_name):
-                    if self._matches_filter(schema, current_word):
-                        yield Completion(schema, start_position=-len(current_word))
+                for schema in self._ranked(self._get_schema_names(model_name), current_word_lower):
+                    yield Completion(schema, start_position=start_position)
         
         elif command == 'types':
             # types [--all | --find <pattern>]
             if len(words) == 1 or (len(words) == 2 and not is_new_arg):
-                flags = ['--all', '--find']
-                for flag in flags:
-                    if self._matches_filter(flag, current_word):
-                        yield Completion(flag, start_position=-len(current_word))
+                for flag in self._ranked(_TYPE_FLAGS, current_word_lower):
+                    yield Completion(flag, start_position=start_position)
             
             elif len(words) >= 2 and words[1] == '--find':
                 # Complete faker types after --find (support incremental search)
                 if len(words) == 2 or (len(words) == 3 and not is_new_arg):
                     # Allow pattern matching on faker types
-                    faker_types = self._get_faker_types()
-                    matching_types = [
-                        (ftype, self._get_completion_priority(ftype, current_word))
-                        for ftype in faker_types
-                        if self._matches_filter(ftype, current_word)
-                    ]
-                    matching_types.sort(key=lambda x: x[1])
-                    for ftype, _ in matching_types:
-                        yield Completion(ftype, start_position=-len(current_word))
+                    for ftype in itertools.islice(self._match_faker_types(current_word_lower), self.max_results):
+                        yield Completion(ftype, start_position=start_position)
         
         elif command == 'info':
             # info <type_name>
             if len(words) == 1 or (len(words) == 2 and not is_new_arg):
-                faker_types = self._get_faker_types()
-                # Sort by priority (prefix matches first) - important for large lists
-                matching_types = [
-                    (ftype, self._get_completion_priority(ftype, current_word))
-                    for ftype in faker_types
-                    if self._matches_filter(ftype, current_word)
-                ]
-                matching_types.sort(key=lambda x: x[1])
-                for ftype, _ in matching_types:
-                    yield Completion(ftype, start_position=-len(current_word))
+                # Prefix matches come from the trie - important for large lists
+                for ftype in itertools.islice(self._match_faker_types(current_word_lower), self.max_results):
+                    yield Completion(ftype, start_position=start_position)
         
         elif command == 'test':
             # test <type_name>
             if len(words) == 1 or (len(words) == 2 and not is_new_arg):
-                faker_types = self._get_faker_types()
-                # Sort by priority (prefix matches first) - important for large lists
-                matching_types = [
-                    (ftype, self._get_completion_priority(ftype, current_word))
-                    for ftype in faker_types
-                    if self._matches_filter(ftype, current_word)
-                ]
-                matching_types.sort(key=lambda x: x[1])
-                for ftype, _ in matching_types:
-                    yield Completion(ftype, start_position=-len(current_word))
-        
-        elif command == 'models':
-            # No arguments
-            pass
+                # Prefix matches come from the trie - important for large lists
+                for ftype in itertools.islice(self._match_faker_types(current_word_lower), self.max_results):
+                    yield Completion(ftype, start_position=start_position)
         
-        elif command in ['experiments', 'exps', 'list', 'ls', 'help', 'clear', 'exit', 'quit']:
+        elif command in _NO_ARG_COMMANDS:
             # No arguments
             pass
 
@@ -281,20 +451,53 @@ class QsynthRepl:
         if not self.yaml_file.exists():
             raise FileNotFoundError(f"YAML file not found: {self.yaml_file}")
         
-        # Load models and experiments
-        with open(self.yaml_file, 'r') as stream:
-            self.config = yaml.safe_load(stream)
-        
-        self.models = [Model(**m) for m in self.config.get('models', [])]
-        self.experiments = self.config.get('experiments', {})
-        
         # REPL state
         self.last_result = None
         self.running = True
         
+        # Command dispatch table; every handler is called as (console, args, session)
+        self._dispatch = {
+            'exit': lambda console, args, session: self._cmd_exit(console),
+            'quit': lambda console, args, session: self._cmd_exit(console),
+            'help': lambda console, args, session: self._cmd_help(console),
+            'list': lambda console, args, session: self._cmd_list(console),
+            'ls': lambda console, args, session: self._cmd_list(console),
+            'models': lambda console, args, session: self._cmd_models(console, args),
+            'schemas': lambda console, args, session: self._cmd_schemas(console, args),
+            'experiments': lambda console, args, session: self._cmd_experiments(console),
+            'exps': lambda console, args, session: self._cmd_experiments(console),
+            'describe': lambda console, args, session: self._cmd_describe(console, args),
+            'run': lambda console, args, session: self._cmd_run(console, args),
+            'types': lambda console, args, session: self._cmd_types(console, args),
+            'info': lambda console, args, session: self._cmd_info(console, args),
+            'preview': lambda console, args, session: self._cmd_preview(console, args),
+            'test': self._cmd_test,
+            'clear': lambda console, args, session: self._cmd_clear(console),
+        }
+        
         # Initialize completer
         self.completer = QsynthCompleter(self)
     
+    @functools.cached_property
+    def config(self) -> dict:
+        """Parsed YAML configuration, loaded on first access."""
+        return load_config_file(self.yaml_file)
+    
+    @functools.cached_property
+    def models(self) -> list:
+        """Models defined in the configuration."""
+        return parse_models(self.config.get('models', []))
+    
+    @functools.cached_property
+    def experiments(self) -> dict:
+        """Experiments defined in the configuration."""
+        return self.config.get('experiments', {})
+    
+    @functools.cached_property
+    def faker(self):
+        """Faker instance shared with the completer, created on first use."""
+        return _shared_faker()
+    
     def run(self):
         """Start the interactive REPL shell."""
         from rich.console import Console
@@ -304,13 +507,18 @@ class QsynthRepl:
         
         console = Console()
         
-        # Welcome banner
+        # Welcome banner - the config is parsed lazily, so counts show only once loaded
+        if 'config' in self.__dict__:
+            models_count = len(self.config.get('models', []))
+            experiments_count = len(self.config.get('experiments', {}))
+        else:
+            models_count = experiments_count = "(not loaded)"
         console.print("\n")
         console.print(Panel(
             f"[bold cyan]Qsynth Interactive Shell[/bold cyan]\n"
-            f"[dim]Loaded:[/dim] {self.yaml_file}\n"
-            f"[dim]Models:[/dim] {len(self.models)}\n"
-            f"[dim]Experiments:[/dim] {len(self.experiments)}",
+            f"[dim]File:[/dim] {self.yaml_file}\n"
+            f"[dim]Models:[/dim] {models_count}\n"
+            f"[dim]Experiments:[/dim] {experiments_count}",
             title="[green]Ready[/green]",
             border_style="green"
         ))
@@ -369,52 +577,22 @@ class QsynthRepl:
     
     def _execute_command(self, console, command: str, args: list, session=None):
         """Execute a REPL command."""
-        cmd_lower = command.lower()
-        
-        if cmd_lower == 'exit' or cmd_lower == 'quit':
-            self.running = False
-            console.print("[dim]Goodbye![/dim]\n")
-        
-        elif cmd_lower == 'help':
-            self._cmd_help(console)
-        
-        elif cmd_lower == 'list' or cmd_lower == 'ls':
-            self._cmd_list(console)
-        
-        elif cmd_lower == 'models':
-            self._cmd_models(console, args)
-        
-        elif cmd_lower == 'schemas':
-            self._cmd_schemas(console, args)
-        
-        elif cmd_lower == 'experiments' or cmd_lower == 'exps':
-            self._cmd_experiments(console)
-        
-        elif cmd_lower == 'describe':
-            self._cmd_describe(console, args)
-        
-        elif cmd_lower == 'run':
-            self._cmd_run(console, args)
-        
-        elif cmd_lower == 'types':
-            self._cmd_types(console, args)
-        
-        elif cmd_lower == 'info':
-            self._cmd_info(console, args)
-        
-        elif cmd_lower == 'preview':
-            self._cmd_preview(console, args)
-        
-        elif cmd_lower == 'test':
-            self._cmd_test(console, args, session)
-        
-        elif cmd_lower == 'clear':
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
-        
-        else:
+        handler = self._dispatch.get(command.lower())
+        if handler is None:
             console.print(f"[bold yellow]Unknown command:[/bold yellow] {command}")
             console.print("[dim]Type 'help' for available commands.[/dim]\n")
+            return
+        handler(console, args, session)
+    
+    def _cmd_exit(self, console):
+        """Stop the REPL loop."""
+        self.running = False
+        console.print("[dim]Goodbye![/dim]\n")
+    
+    def _cmd_clear(self, console):
+        """Clear the terminal screen."""
+        import os
+        os.system('cls' if os.name == 'nt' else 'clear')
     
     def _cmd_help(self, console):
         """Show help message."""
@@ -464,6 +642,7 @@ class QsynthRepl:
     
     def _cmd_list(self, console):
         """List all models, schemas, and experiments."""
+        from qsynth import main as _main
         _main.list_schema_content(self.yaml_file, self.config)
     
     def _cmd_models(self, console, args):
@@ -505,6 +684,7 @@ class QsynthRepl:
     
     def _cmd_describe(self, console, args):
         """Describe a model, schema, or all experiments."""
+        from qsynth import main as _main
         if not args:
             console.print("[bold yellow]Usage:[/bold yellow] describe <model|schema|experiments> [name]\n")
             return
@@ -536,6 +716,7 @@ class QsynthRepl:
     
     def _cmd_run(self, console, args):
         """Run experiments."""
+        from qsynth import main as _main
         if not args:
             # Run all experiments
             console.print("[bold cyan]Running all experiments...[/bold cyan]\n")
@@ -547,6 +728,7 @@ class QsynthRepl:
     
     def _cmd_types(self, console, args):
         """List or search for Faker provider types."""
+        from qsynth import main as _main
         # Parse args
         find_arg = None
         all_arg = False
@@ -571,6 +753,7 @@ class QsynthRepl:
     
     def _cmd_info(self, console, args):
         """Show detailed info about a Faker type."""
+        from qsynth import main as _main
         if not args:
             console.print("[bold yellow]Usage:[/bold yellow] info <type_name>\n")
             return
@@ -580,6 +763,7 @@ class QsynthRepl:
     
     def _cmd_preview(self, console, args):
         """Preview generated data."""
+        from qsynth import main as _main
         # Parse args for model, schema, and rows
         model_name = None
         schema_name = None
@@ -587,19 +771,12 @@ class QsynthRepl:
         
         i = 0
         while i < len(args):
-            if args[i] == '--rows' and i + 1 < len(args):
+            if args[i] in _PREVIEW_FLAG_SET and i + 1 < len(args):
                 try:
                     rows = int(args[i + 1])
                     i += 2
                 except ValueError:
-                    console.print("[bold red]Error:[/bold red] --rows must be an integer\n")
-                    return
-            elif args[i] == '-r' and i + 1 < len(args):
-                try:
-                    rows = int(args[i + 1])
-                    i += 2
-                except ValueError:
-                    console.print("[bold red]Error:[/bold red] -r must be an integer\n")
+                    console.print(f"[bold red]Error:[/bold red] {args[i]} must be an integer\n")
                     return
             elif not model_name:
                 model_name = args[i]
@@ -614,6 +791,8 @@ class QsynthRepl:
     
     def _cmd_test(self, console, args, session):
         """Test a Faker type by generating sample values with custom parameters."""
+        from rich.markup import escape
+        from rich.syntax import Syntax
         from rich.table import Table
         
         if not args:
@@ -622,7 +801,7 @@ class QsynthRepl:
             return
         
         type_name = args[0]
-        faker = _main.create_faker()
+        faker = self.faker
         
         # Check if type exists
         if not hasattr(faker, type_name):
@@ -637,22 +816,9 @@ class QsynthRepl:
                 console.print(f"[bold red]Error:[/bold red] '[yellow]{type_name}[/yellow]' is not a callable method.\n")
                 return
             
-            # Get signature
-            sig = inspect.signature(method)
-            params = sig.parameters
-            
-            # Collect parameters
+            # Parameters are cached per underlying function, so repeated tests skip introspection
+            required_params, optional_params = _method_parameters(getattr(method, '__func__', method))
             kwargs = {}
-            required_params = []
-            optional_params = []
-            
-            for param_name, param in params.items():
-                if param_name == 'self':
-                    continue
-                if param.default == inspect.Parameter.empty:
-                    required_params.append((param_name, param))
-                else:
-                    optional_params.append((param_name, param, param.default))
             
             # Show parameter info
             console.print(f"\n[bold cyan]Testing type:[/bold cyan] [yellow]{type_name}[/yellow]\n")
@@ -661,11 +827,7 @@ class QsynthRepl:
                 console.print("[bold]Parameters:[/bold]\n")
                 
                 # Prompt for required parameters
-                for param_name, param in required_params:
-                    param_type = "-"
-                    if param.annotation != inspect.Parameter.empty:
-                        param_type = param.annotation.__name__ if hasattr(param.annotation, '__name__') else str(param.annotation)
-                    
+                for param_name, param_type, annotation in required_params:
                     console.print(f"[cyan]{param_name}[/cyan] ({param_type}) [bold red]*required*[/bold red]")
                     
                     while True:
@@ -677,7 +839,7 @@ class QsynthRepl:
                                 continue
                             
                             # Try to convert to appropriate type
-                            value = self._parse_parameter_value(value_str, param.annotation)
+                            value = self._parse_parameter_value(value_str, annotation)
                             kwargs[param_name] = value
                             break
                         except (ValueError, TypeError) as e:
@@ -687,11 +849,7 @@ class QsynthRepl:
                             return
                 
                 # Prompt for optional parameters
-                for param_name, param, default_value in optional_params:
-                    param_type = "-"
-                    if param.annotation != inspect.Parameter.empty:
-                        param_type = param.annotation.__name__ if hasattr(param.annotation, '__name__') else str(param.annotation)
-                    
+                for param_name, param_type, annotation, default_value in optional_params:
                     default_str = str(default_value)
                     console.print(f"[cyan]{param_name}[/cyan] ({param_type}) [dim]default: {default_str}[/dim]")
                     
@@ -701,7 +859,7 @@ class QsynthRepl:
                         if value_str:
                             # Try to convert to appropriate type
                             try:
-                                value = self._parse_parameter_value(value_str, param.annotation)
+                                value = self._parse_parameter_value(value_str, annotation)
                                 kwargs[param_name] = value
                             except (ValueError, TypeError):
                                 # If conversion fails, use default
@@ -718,20 +876,30 @@ class QsynthRepl:
             # Generate 10 values
             console.print(f"\n[bold green]Generating 10 sample values...[/bold green]\n")
             
+            # Bind the parameters once, collect the rows, then build the table in one pass.
+            # Failures are almost always deterministic (bad parameters), so the first
+            # error ends sampling and is reported once instead of being retried per row.
+            # Loop-invariant callables are bound to locals for the sampling loop
+            sample = functools.partial(method, **kwargs)
+            rows = []
+            append_row, text_type, length = rows.append, str, len
+            try:
+                for _ in range(10):
+                    value = sample()
+                    value_str = value if value.__class__ is text_type else text_type(value)
+                    # Truncate very long values before escaping, so markup escapes are never cut
+                    if length(value_str) > 80:
+                        value_str = value_str[:77] + "..."
+                    append_row(escape(value_str))
+            except Exception as e:
+                rows.append(f"[red]Error: {escape(str(e))}[/red]")
+            
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("#", style="cyan", width=4)
             table.add_column("Value", style="green", overflow="fold")
-            
-            for i in range(1, 11):
-                try:
-                    value = method(**kwargs)
-                    value_str = str(value)
-                    # Truncate very long values
-                    if len(value_str) > 80:
-                        value_str = value_str[:77] + "..."
-                    table.add_row(str(i), value_str)
-                except Exception as e:
-                    table.add_row(str(i), f"[red]Error: {e}[/red]")
+            add_row = table.add_row
+            for i, value_str in enumerate(rows, 1):
+                add_row(str(i), value_str)
             
             console.print(table)
             console.print()
@@ -742,77 +910,62 @@ class QsynthRepl:
             console.print("[dim]# Replace 'attribute_name' with your desired attribute name[/dim]\n")
             
             # Build YAML structure
-            yaml_lines = ["- name: attribute_name"]
-            yaml_lines.append(f"  type: {type_name}")
-            
-            if kwargs:
-                yaml_lines.append("  params:")
-                for param_name, param_value in sorted(kwargs.items()):
-                    yaml_value = self._format_yaml_value(param_value)
-                    yaml_lines.append(f"    {param_name}: {yaml_value}")
-            
-            yaml_text = "\n".join(yaml_lines)
+            params_block = "".join(
+                f"\n    {param_name}: {_yaml_value(param_value)}"
+                for param_name, param_value in sorted(kwargs.items())
+            )
+            if params_block:
+                params_block = "\n  params:" + params_block
+            yaml_text = f"- name: attribute_name\n  type: {type_name}{params_block}"
             
             # Display with syntax highlighting
-            from rich.syntax import Syntax
             console.print(Syntax(yaml_text, "yaml", theme="monokai", line_numbers=False))
             console.print()
             
         except Exception as e:
             console.print(f"[bold red]Error:[/bold red] {e}\n")
-            import traceback
             console.print(f"[dim]{traceback.format_exc()}[/dim]\n")
     
     def _format_yaml_value(self, value: any) -> str:
         """Format a Python value for YAML output."""
-        if isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, str):
-            # Quote strings that might need quoting
-            if any(c in value for c in [' ', ':', '#', '&', '*', '?', '|', '-', '<', '>', '=', '!', '%', '@', '`']):
-                return f'"{value}"'
-            return value
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, list):
-            items = [self._format_yaml_value(item) for item in value]
-            return f"[{', '.join(items)}]"
-        elif value is None:
-            return "null"
-        else:
-            return str(value)
+        return _yaml_value(value)
     
     def _parse_parameter_value(self, value_str: str, annotation) -> any:
         """Parse a string value to the appropriate type based on annotation."""
-        if not annotation or annotation == inspect.Parameter.empty:
-            # Try to infer type from value
-            try:
-                # Try int
-                if '.' not in value_str:
-                    return int(value_str)
-                # Try float
-                return float(value_str)
-            except ValueError:
-                # Return as string
-                return value_str
+        import inspect
+        if not annotation or annotation is inspect.Parameter.empty:
+            return _infer_value(value_str)
+        
+        # Plain types dispatch directly
+        if isinstance(annotation, type):
+            parser = _TYPE_PARSERS.get(annotation)
+            if parser is not None:
+                return parser(value_str)
+        
+        # Optional[...] / Union[...]: first member type that parses the value wins
+        if typing.get_origin(annotation) in _UNION_ORIGINS:
+            error = None
+            for arg in typing.get_args(annotation):
+                parser = _TYPE_PARSERS.get(arg)
+                if parser is None:
+                    continue
+                try:
+                    return parser(value_str)
+                except ValueError as e:
+                    error = e
+            if error is not None:
+                raise error
         
-        # Convert based on annotation
-        annotation_str = str(annotation)
+        # String annotations and other typing constructs
+        annotation_str = _annotation_str(annotation)
         
-        if 'int' in annotation_str or annotation == int:
+        if 'int' in annotation_str:
             return int(value_str)
-        elif 'float' in annotation_str or 'double' in annotation_str or annotation == float:
+        elif 'float' in annotation_str or 'double' in annotation_str:
             return float(value_str)
-        elif 'bool' in annotation_str or annotation == bool:
-            return value_str.lower() in ('true', '1', 'yes', 'on')
-        elif 'str' in annotation_str or annotation == str:
+        elif 'bool' in annotation_str:
+            return _parse_bool(value_str)
+        elif 'str' in annotation_str:
             return value_str
         else:
-            # Try common conversions
-            try:
-                if '.' not in value_str:
-                    return int(value_str)
-                return float(value_str)
-            except ValueError:
-                return value_str
-
+            return _infer_value(value_str)
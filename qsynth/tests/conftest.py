@@ -0,0 +1,36 @@
+"""Shared pytest fixtures."""
+import contextlib
+import io
+
+import pytest
+
+from qsynth import cli
+from qsynth import main
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Build the shared en-US Faker up front so no single test pays for first use."""
+    main.MultiModelsFaker([{'name': '_warmup', 'locales': ['en-US'], 'schemas': []}]).generate_all()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """CLI argument parser, built once per test session."""
+    return cli.argument_parser()
+
+
+@pytest.fixture(scope="session")
+def type_info_output():
+    """Return main.show_type_info output for a type name, rendered once per session."""
+    cache = {}
+    
+    def render(type_name):
+        if type_name not in cache:
+            buf = io.StringIO()
+            with contextlib.redirect_stdout(buf):
+                main.show_type_info(type_name)
+            cache[type_name] = buf.getvalue()
+        return cache[type_name]
+    
+    return render
@@ -1,76 +1,71 @@
-from qsynth import cli
 from qsynth import main
 
 
-def test_new_cli_module_parses_types():
-    p = cli.argument_parser().parse_args(['types', '--all'])
+def test_new_cli_module_parses_types(parser):
+    p = parser.parse_args(['types', '--all'])
     assert p.command == 'types'
     assert p.all is True
 
 
-def test_new_cli_module_parses_run():
-    p = cli.argument_parser().parse_args(['run', '-i', 'x.yaml', '-a'])
+def test_new_cli_module_parses_run(parser):
+    p = parser.parse_args(['run', '-i', 'x.yaml', '-a'])
     assert p.command == 'run'
     assert p.input_file == 'x.yaml'
     assert p.run_all_experiments is True
 
 
-def test_new_cli_module_parses_show_type():
-    p = cli.argument_parser().parse_args(['show-type', 'first_name'])
+def test_new_cli_module_parses_show_type(parser):
+    p = parser.parse_args(['show-type', 'first_name'])
     assert p.command == 'show-type'
     assert p.type_name == 'first_name'
 
 
-def test_new_cli_module_parses_schema():
-    p = cli.argument_parser().parse_args(['schema', 'test.yaml'])
+def test_new_cli_module_parses_schema(parser):
+    p = parser.parse_args(['schema', 'test.yaml'])
     assert p.command == 'schema'
     assert p.yaml_file == 'test.yaml'
     assert p.model is None
     assert p.schema is None
 
 
-def test_new_cli_module_parses_schema_with_filters():
-    p = cli.argument_parser().parse_args(['schema', 'test.yaml', '--model', 'mymodel', '--schema', 'myschema'])
+def test_new_cli_module_parses_schema_with_filters(parser):
+    p = parser.parse_args(['schema', 'test.yaml', '--model', 'mymodel', '--schema', 'myschema'])
     assert p.command == 'schema'
     assert p.yaml_file == 'test.yaml'
     assert p.model == 'mymodel'
     assert p.schema == 'myschema'
 
 
-def test_show_type_info_for_first_name(capsys):
+def test_show_type_info_for_first_name(type_info_output):
     """Test showing information for first_name type."""
-    main.show_type_info('first_name')
-    captured = capsys.readouterr()
-    assert 'Type: first_name' in captured.out
-    assert 'Parameters:' in captured.out
+    out = type_info_output('first_name')
+    assert 'Type: first_name' in out
+    assert 'Parameters:' in out
 
 
-def test_show_type_info_for_random_int(capsys):
+def test_show_type_info_for_random_int(type_info_output):
     """Test showing information for random_int type with parameters."""
-    main.show_type_info('random_int')
-    captured = capsys.readouterr()
-    assert 'Type: random_int' in captured.out
+    out = type_info_output('random_int')
+    assert 'Type: random_int' in out
     # Rich uses unicode box drawing characters, so we just check for the parameter names
-    assert 'min' in captured.out
-    assert 'max' in captured.out
+    assert 'min' in out
+    assert 'max' in out
 
 
-def test_show_type_info_for_ref_type(capsys):
+def test_show_type_info_for_ref_type(type_info_output):
     """Test showing information for ${ref} type."""
-    main.show_type_info('${ref}')
-    captured = capsys.readouterr()
-    assert 'Type: ${ref}' in captured.out
-    assert 'dataset:' in captured.out
-    assert 'attribute:' in captured.out
-    assert 'cord:' in captured.out
-    assert 'Example:' in captured.out
+    out = type_info_output('${ref}')
+    assert 'Type: ${ref}' in out
+    assert 'dataset:' in out
+    assert 'attribute:' in out
+    assert 'cord:' in out
+    assert 'Example:' in out
 
 
-def test_show_type_info_for_nonexistent(capsys):
+def test_show_type_info_for_nonexistent(type_info_output):
     """Test showing information for non-existent type."""
-    main.show_type_info('nonexistent_type_xyz')
-    captured = capsys.readouterr()
-    assert "Error: Type 'nonexistent_type_xyz' not found" in captured.out
+    out = type_info_output('nonexistent_type_xyz')
+    assert "Error: Type 'nonexistent_type_xyz' not found" in out
 
 
 def test_show_schema_info_for_formats_yaml(capsys):
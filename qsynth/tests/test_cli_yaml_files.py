@@ -2,26 +2,36 @@
 import subprocess
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 
+from qsynth.main import exec_cli
+
 # Path to project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 
-def run_cli_command(args):
-    """Run qsynth CLI command and return result."""
-    cmd = [sys.executable, "-m", "qsynth"] + args
-    result = subprocess.run(
-        cmd,
-        cwd=PROJECT_ROOT,
-        capture_output=True,
-        text=True,
-        timeout=60  # 60 second timeout for safety
-    )
-    return result
+@pytest.fixture
+def run_cli_command(monkeypatch, capsys):
+    """Run qsynth CLI commands in-process from the project root and return the result."""
+    monkeypatch.chdir(PROJECT_ROOT)
+    
+    def run(args):
+        returncode = 0
+        try:
+            exec_cli(args)
+        except SystemExit as e:
+            returncode = e.code or 0
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+        out, err = capsys.readouterr()
+        return SimpleNamespace(returncode=returncode, stdout=out, stderr=err)
+    
+    return run
 
 
-def test_cli_formats_yaml_runs_all_experiments():
+def test_cli_formats_yaml_runs_all_experiments(run_cli_command):
     """Test that formats.yaml runs all experiments successfully."""
     result = run_cli_command([
         "run",
@@ -36,7 +46,7 @@ def test_cli_formats_yaml_runs_all_experiments():
     assert "Init Avro writer" in result.stdout or "avro" in result.stdout.lower()
 
 
-def test_cli_moneta_yaml_runs_all_experiments():
+def test_cli_moneta_yaml_runs_all_experiments(run_cli_command):
     """Test that moneta.yaml runs all experiments successfully."""
     result = run_cli_command([
         "run",
@@ -53,7 +63,7 @@ def test_cli_moneta_yaml_runs_all_experiments():
     assert "sql" in output_lower or "Init SQL writer" in result.stdout
 
 
-def test_cli_models_yaml_runs_all_experiments():
+def test_cli_models_yaml_runs_all_experiments(run_cli_command):
     """Test that models.yaml runs all experiments including cron_feed."""
     result = run_cli_command([
         "run",
@@ -72,7 +82,7 @@ def test_cli_models_yaml_runs_all_experiments():
     assert "2023-01" in result.stdout or "2023-02" in result.stdout
 
 
-def test_cli_formats_yaml_single_experiment():
+def test_cli_formats_yaml_single_experiment(run_cli_command):
     """Test running a single experiment from formats.yaml."""
     result = run_cli_command([
         "run",
@@ -84,7 +94,7 @@ def test_cli_formats_yaml_single_experiment():
     assert "parquet" in result.stdout.lower() or "Init Parquet writer" in result.stdout
 
 
-def test_cli_moneta_yaml_single_experiment():
+def test_cli_moneta_yaml_single_experiment(run_cli_command):
     """Test running a single experiment from moneta.yaml."""
     result = run_cli_command([
         "run",
@@ -96,7 +106,7 @@ def test_cli_moneta_yaml_single_experiment():
     assert "csv" in result.stdout.lower() or "Init CSV writer" in result.stdout
 
 
-def test_cli_invalid_file_returns_error():
+def test_cli_invalid_file_returns_error(run_cli_command):
     """Test that CLI returns error for non-existent file."""
     result = run_cli_command([
         "run",
@@ -107,7 +117,7 @@ def test_cli_invalid_file_returns_error():
     assert result.returncode != 0, "CLI should fail for non-existent file"
 
 
-def test_cli_models_yaml_multiple_experiments():
+def test_cli_models_yaml_multiple_experiments(run_cli_command):
     """Test running multiple specific experiments from models.yaml."""
     result = run_cli_command([
         "run",
@@ -121,30 +131,18 @@ def test_cli_models_yaml_multiple_experiments():
     assert "parquet" in output_lower or "Init Parquet writer" in result.stdout
 
 
-def test_cli_formats_yaml_generates_output_files(tmp_path):
+def test_cli_formats_yaml_generates_output_files(tmp_path, run_cli_command):
     """Test that formats.yaml generates actual output files."""
-    # Copy formats.yaml to temp directory and modify paths safely
+    # Copy formats.yaml to temp directory, pointing output paths at the temp directory
     formats_yaml = PROJECT_ROOT / "formats.yaml"
     if formats_yaml.exists():
-        import yaml
+        text = formats_yaml.read_text()
+        assert ".test-data/" in text
         
-        # Load original YAML
-        with open(formats_yaml, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        # Modify paths to use temp directory (using forward slashes for YAML)
+        # Replace .test-data/ with temp directory path (using forward slashes for YAML)
         output_base = str(tmp_path / "test-data").replace("\\", "/")
-        for exp_name, exp_config in config.get('experiments', {}).items():
-            if 'path' in exp_config:
-                original_path = exp_config['path']
-                # Replace .test-data/ with temp directory path
-                if original_path.startswith(".test-data/"):
-                    exp_config['path'] = original_path.replace(".test-data/", f"{output_base}/")
-        
-        # Write modified YAML
         test_yaml = tmp_path / "formats.yaml"
-        with open(test_yaml, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        test_yaml.write_text(text.replace(".test-data/", f"{output_base}/"))
         
         # Run CLI with modified YAML
         result = run_cli_command([
@@ -157,4 +155,18 @@ def test_cli_formats_yaml_generates_output_files(tmp_path):
         
         # Check that command executed successfully
         assert "Init Parquet writer" in result.stdout or "Parquet" in result.stdout.lower()
+        assert any((tmp_path / "test-data").rglob("*.parquet"))
 
+
+def test_cli_module_entry_point_smoke():
+    """Test that `python -m qsynth` runs an experiment end to end in a subprocess."""
+    result = subprocess.run(
+        [sys.executable, "-m", "qsynth", "run", "--input-file", "moneta.yaml", "--experiment", "write_csv"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60  # 60 second timeout for safety
+    )
+    
+    assert result.returncode == 0, f"CLI failed with stderr: {result.stderr}"
+    assert "csv" in result.stdout.lower() or "Init CSV writer" in result.stdout
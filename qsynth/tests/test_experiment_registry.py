@@ -1,4 +1,6 @@
 """Tests for experiment registry system."""
+from datetime import datetime
+
 import pytest
 
 from qsynth.experiments import (
@@ -63,3 +65,21 @@ def test_experiment_instantiates_correctly():
     assert experiment.models == models
     assert experiment.path_template == 'test.csv'
 
+
+def test_experiment_resolves_path_templates(tmp_path):
+    """Test path templates render named, formatted and literal parts."""
+    experiment = get_experiment_class('csv')(
+        config={'type': 'csv', 'path': 'x.csv'},
+        models=[],
+        relative_to=tmp_path
+    )
+    
+    path = experiment._resolve_path(
+        '{model-name}/{dataset-name}-{cron-date:%Y-%m-%d}.csv',
+        **{'model-name': 'm', 'dataset-name': 'd', 'cron-date': datetime(2024, 1, 2)}
+    )
+    assert path == (tmp_path / 'm' / 'd-2024-01-02.csv').absolute()
+    assert experiment._resolve_path('{{literal}}.csv') == (tmp_path / '{literal}.csv').absolute()
+    
+    with pytest.raises(KeyError):
+        experiment._resolve_path('{dataset-name}.csv')
@@ -1,15 +1,20 @@
 """Integration tests for all experiment types."""
+import json
 import yaml
+import os
 from pathlib import Path
 import pytest
 
 from qsynth.models import Model
-from qsynth.experiments import get_experiment_class
-from qsynth.main import load
+from qsynth.experiments import EXPERIMENT_REGISTRY, get_experiment_class
+from qsynth.main import Experiments, load
 
 
-# Test output directory - use real directory structure
-TEST_OUTPUT_BASE = Path(__file__).parent.parent.parent / ".test-data" / ".ut"
+# Test output directory - use real directory structure; one subdirectory per xdist worker
+TEST_OUTPUT_BASE = Path(__file__).parent.parent.parent / ".test-data" / ".ut" / os.environ.get("PYTEST_XDIST_WORKER", "")
+
+# libyaml-backed dumper when available; load() already parses with CSafeLoader
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def create_minimal_model_yaml(output_dir: Path):
@@ -34,263 +39,152 @@ def create_minimal_model_yaml(output_dir: Path):
     }
 
 
-class TestCsvExperiment:
-    def test_csv_experiment_runs(self, tmp_path):
-        """Test CSV experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "csv"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_csv': {
-                'type': 'csv',
-                'path': str(output_dir / '{dataset-name}.csv'),
-                'params': {'index': False}
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_csv')
-        
-        # Check file was created
-        csv_file = output_dir / "testdata.csv"
-        assert csv_file.exists()
-
-
-class TestParquetExperiment:
-    def test_parquet_experiment_runs(self, tmp_path):
-        """Test Parquet experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "parquet"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_parquet': {
-                'type': 'parquet',
-                'path': str(output_dir / '{dataset-name}.parquet'),
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_parquet')
-        
-        # Check file was created
-        parquet_file = output_dir / "testdata.parquet"
-        assert parquet_file.exists()
-
-
-class TestAvroExperiment:
-    def test_avro_experiment_runs(self, tmp_path):
-        """Test Avro experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "avro"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_avro': {
-                'type': 'avro',
-                'path': str(output_dir / '{dataset-name}.avro'),
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_avro')
-        
-        # Check file was created
-        avro_file = output_dir / "testdata.avro"
-        assert avro_file.exists()
-
-
-class TestSqlExperiment:
-    def test_sql_experiment_runs(self, tmp_path):
-        """Test SQL experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "sql"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_sql': {
-                'type': 'sql',
-                'path': str(output_dir / '{model-name}.sql'),
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_sql')
-        
-        # Check file was created
-        sql_file = output_dir / "testmodel.sql"
-        assert sql_file.exists()
-        
-        # Check content
-        content = sql_file.read_text()
-        assert "CREATE TABLE" in content.upper()
-
-
-class TestErModelExperiment:
-    def test_ermodel_experiment_runs(self, tmp_path):
-        """Test ER Model experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "ermodel"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_ermodel': {
-                'type': 'ermodel',
-                'path': str(output_dir / '{model-name}.puml'),
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_ermodel')
-        
-        # Check file was created
-        puml_file = output_dir / "testmodel.puml"
-        assert puml_file.exists()
-        
-        content = puml_file.read_text()
-        assert "@startuml" in content
-
-
-class TestMermaidExperiment:
-    def test_mermaid_experiment_runs(self, tmp_path):
-        """Test Mermaid experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "mermaid"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_mermaid': {
-                'type': 'mermaid',
-                'path': str(output_dir / '{model-name}.mmd'),
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_mermaid')
-        
-        # Check file was created
-        mmd_file = output_dir / "testmodel.mmd"
-        assert mmd_file.exists()
-        
-        content = mmd_file.read_text()
-        assert "erDiagram" in content
+@pytest.fixture(scope="module")
+def tmp_yaml_dir(tmp_path_factory):
+    """Directory for the generated test YAML files, shared by the module."""
+    return tmp_path_factory.mktemp("experiments")
+
+
+# The model part of every test config is identical, so it is built and dumped once
+_BASE_CONFIG = create_minimal_model_yaml(TEST_OUTPUT_BASE)
+_BASE_YAML = yaml.dump(_BASE_CONFIG, Dumper=Dumper)
+_BASE_MODEL = Model.model_validate(_BASE_CONFIG['models'][0])
+
+
+def dump_config(experiments: dict, stream) -> None:
+    """Write the minimal model YAML with the given experiments section appended to stream."""
+    stream.write(_BASE_YAML)
+    yaml.dump({'experiments': experiments}, stream, Dumper=Dumper)
+
+
+# (output kind, experiment config without path, path template, expected file glob, expected content)
+EXPERIMENT_CASES = [
+    ('csv', {'type': 'csv', 'params': {'index': False}},
+     '{dataset-name}.csv', 'testdata.csv', ()),
+    ('parquet', {'type': 'parquet'},
+     '{dataset-name}.parquet', 'testdata.parquet', ()),
+    ('avro', {'type': 'avro'},
+     '{dataset-name}.avro', 'testdata.avro', ()),
+    ('sql', {'type': 'sql'},
+     '{model-name}.sql', 'testmodel.sql', ('CREATE TABLE',)),
+    ('ermodel', {'type': 'ermodel'},
+     '{model-name}.puml', 'testmodel.puml', ('@startuml',)),
+    ('mermaid', {'type': 'mermaid'},
+     '{model-name}.mmd', 'testmodel.mmd', ('erDiagram',)),
+    ('meta', {'type': 'meta'},
+     '{model-name}-meta.yaml', 'testmodel-meta.yaml', ('schemas',)),
+    ('llm_prompt', {'type': 'llm-prompt', 'params': {'prologue': 'Test prologue', 'epilogue': 'Test epilogue'}},
+     '{model-name}.prompt', 'testmodel.prompt', ('Test prologue', 'Test epilogue', 'Tables:')),
+    ('cron_feed', {'type': 'cron_feed',
+                   'cron': '0 12 * * *',
+                   'dates': {'from': '2023-01-01', 'to': '2023-01-03', 'count': 2},
+                   'writer': {'name': 'csv', 'params': {'index': False}}},
+     '{dataset-name}-{cron-date:%Y-%m-%d}.csv', 'testdata-2023-01-*.csv', ()),
+]
+
+
+def test_all_experiments_single_model(tmp_path):
+    """Test every experiment type runs from one Experiments instance and creates its output files."""
+    experiments_config = {
+        f"test_{kind}": {**experiment, 'path': str(tmp_path / kind / path_template)}
+        for kind, experiment, path_template, _, _ in EXPERIMENT_CASES
+    }
+    
+    # The YAML parser path is covered by test_experiment_runs_from_yaml_file
+    experiments = Experiments(experiments_config, [_BASE_MODEL], relative_to=tmp_path)
+    experiments.run_all()
+    
+    # Check files were created, per experiment type
+    for kind, _, _, expected_glob, expected_content in EXPERIMENT_CASES:
+        files = sorted((tmp_path / kind).glob(expected_glob))
+        assert files, f"{kind}: no file matching {expected_glob}"
+        
+        if expected_content:
+            content = files[0].read_text()
+            for expected in expected_content:
+                assert expected in content, f"{kind}: {expected!r} not in output"
+
+
+def test_cron_feed_finalizes_writer(tmp_path):
+    """Test cron_feed finalizes its writer so streamed outputs are complete."""
+    experiments_config = {
+        'test_cron_ermodel': {'type': 'cron_feed',
+                              'cron': '0 12 * * *',
+                              'dates': {'from': '2023-01-01', 'count': 2},
+                              'writer': {'name': 'ermodel'},
+                              'path': str(tmp_path / '{model-name}-{cron-date:%Y-%m-%d}.puml')},
+    }
+    Experiments(experiments_config, [_BASE_MODEL], relative_to=tmp_path).run_all()
+    
+    files = sorted(tmp_path.glob('testmodel-2023-01-*.puml'))
+    assert len(files) == 2
+    for f in files:
+        assert f.read_text().endswith("@enduml\n")
 
 
-class TestMetaExperiment:
-    def test_meta_experiment_runs(self, tmp_path):
-        """Test Meta experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "meta"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_meta': {
-                'type': 'meta',
-                'path': str(output_dir / '{model-name}-meta.yaml'),
-            }
+def test_experiment_runs_from_yaml_file(tmp_yaml_dir):
+    """Test an experiment loaded from a YAML file executes and creates files."""
+    output_dir = TEST_OUTPUT_BASE / "experiments" / "csv"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    yaml_file = tmp_yaml_dir / "csv.yaml"
+    experiments_config = {
+        'test_csv_yaml': {
+            'type': 'csv',
+            'path': str(output_dir / 'yaml-{dataset-name}.csv'),
+            'params': {'index': False}
         }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_meta')
-        
-        # Check file was created
-        meta_file = output_dir / "testmodel-meta.yaml"
-        assert meta_file.exists()
-        
-        content = meta_file.read_text()
-        assert "schemas" in content
+    }
+    
+    with open(yaml_file, "w", encoding="utf-8") as f:
+        dump_config(experiments_config, f)
+    
+    experiments = load(str(yaml_file))
+    experiments.run('test_csv_yaml')
+    
+    # Check file was created
+    assert (output_dir / "yaml-testdata.csv").exists()
 
 
-class TestLLMPromptExperiment:
-    def test_llm_prompt_experiment_runs(self, tmp_path):
-        """Test LLM Prompt experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "llm_prompt"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_llm_prompt': {
-                'type': 'llm-prompt',
-                'path': str(output_dir / '{model-name}.prompt'),
-                'params': {
-                    'prologue': 'Test prologue',
-                    'epilogue': 'Test epilogue'
-                }
+def test_experiment_runs_from_json_file(tmp_yaml_dir):
+    """Test an experiment loaded from a JSON config file executes and creates files."""
+    output_dir = tmp_yaml_dir / "json-output"
+    
+    config_file = tmp_yaml_dir / "csv.json"
+    config = {
+        **_BASE_CONFIG,
+        'experiments': {
+            'test_csv_json': {
+                'type': 'csv',
+                'path': str(output_dir / '{dataset-name}.csv'),
+                'params': {'index': False}
             }
         }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_llm_prompt')
-        
-        # Check file was created
-        prompt_file = output_dir / "testmodel.prompt"
-        assert prompt_file.exists()
-        
-        content = prompt_file.read_text()
-        assert "Test prologue" in content
-        assert "Test epilogue" in content
-        assert "Tables:" in content
+    }
+    
+    config_file.write_text(json.dumps(config))
+    
+    experiments = load(str(config_file))
+    experiments.run('test_csv_json')
+    
+    # Check file was created
+    assert (output_dir / "testdata.csv").exists()
 
 
-class TestCronFeedExperiment:
-    def test_cron_feed_experiment_runs(self, tmp_path):
-        """Test Cron Feed experiment executes and creates files."""
-        output_dir = TEST_OUTPUT_BASE / "experiments" / "cron_feed"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        yaml_file = tmp_path / "test.yaml"
-        config = create_minimal_model_yaml(output_dir)
-        config['experiments'] = {
-            'test_cron_feed': {
-                'type': 'cron_feed',
-                'cron': '0 12 * * *',
-                'dates': {
-                    'from': '2023-01-01',
-                    'to': '2023-01-03',
-                    'count': 2
-                },
-                'path': str(output_dir / '{dataset-name}-{cron-date:%Y-%m-%d}.csv'),
-                'writer': {
-                    'name': 'csv',
-                    'params': {'index': False}
-                }
-            }
-        }
-        
-        yaml_file.write_text(yaml.dump(config))
-        
-        experiments = load(str(yaml_file))
-        experiments.run('test_cron_feed')
-        
-        # Check files were created for dates
-        files = list(output_dir.glob("*.csv"))
-        assert len(files) > 0
-        assert any("2023-01" in str(f) for f in files)
+def test_load_rereads_changed_config(tmp_yaml_dir):
+    """Test load() caches parsing but picks up a rewritten config file."""
+    config_file = tmp_yaml_dir / "reload.json"
+    experiments = {'first': {'type': 'csv', 'path': 'first.csv'}}
+    config_file.write_text(json.dumps({**_BASE_CONFIG, 'experiments': experiments}))
+    
+    first = load(str(config_file))
+    again = load(str(config_file))
+    assert list(again.exps) == ['first']
+    assert again.exps is not first.exps
+    
+    experiments['second_experiment'] = {'type': 'csv', 'path': 'second.csv'}
+    config_file.write_text(json.dumps({**_BASE_CONFIG, 'experiments': experiments}))
+    assert list(load(str(config_file)).exps) == ['first', 'second_experiment']
 
 
 class TestExperimentRegistry:
@@ -299,9 +193,8 @@ class TestExperimentRegistry:
         types = ['csv', 'parquet', 'avro', 'sql', 'ermodel', 'mermaid', 'llm-prompt', 'meta', 'cron_feed']
         
         for exp_type in types:
-            exp_class = get_experiment_class(exp_type)
-            assert exp_class is not None
-            assert hasattr(exp_class, 'run')
+            assert exp_type in EXPERIMENT_REGISTRY
+            assert hasattr(EXPERIMENT_REGISTRY[exp_type], 'run')
     
     def test_plantuml_alias_works(self):
         """Test that 'plantuml' is an alias for 'ermodel'."""
@@ -1,9 +1,12 @@
 import pandas as pd
+import pytest
 
 from qsynth.main import MultiModelsFaker
 
 
-def test_generate_two_schemas_and_reference():
+@pytest.fixture(scope="module")
+def generated_models():
+    """Generate all test models in one MultiModelsFaker pass, shared by the module."""
     models = [
         {
             'name': 'm1',
@@ -26,13 +29,34 @@ def test_generate_two_schemas_and_reference():
                     ],
                 },
             ],
-        }
+        },
+        {
+            'name': 'm_empty',
+            'locales': ['en-US'],
+            'schemas': [
+                {
+                    'name': 'empty',
+                    'rows': 0,
+                    'attributes': [
+                        {'name': 'id', 'type': 'random_int', 'params': {'min': 1, 'max': 9}},
+                    ],
+                },
+            ],
+        },
+        {
+            'name': 'm_noschemas',
+            'locales': ['en-US'],
+            # 'schemas' key intentionally omitted
+        },
     ]
 
     mmf = MultiModelsFaker(models)
     mmf.generate_all()
+    return mmf.models
 
-    model = mmf.models['m1']
+
+def test_generate_two_schemas_and_reference(generated_models):
+    model = generated_models['m1']
     assert set(model.generated.keys()) == {'base', 'child'}
 
     base_df = model.generated['base']
@@ -50,41 +74,53 @@ def test_generate_two_schemas_and_reference():
     assert set(child_df['parent_id'].tolist()).issubset(base_ids)
 
 
-def test_zero_rows_schema_generates_empty_dataframe():
+def test_zero_rows_schema_generates_empty_dataframe(generated_models):
+    df = generated_models['m_empty'].generated['empty']
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 0
+
+
+def test_model_without_schemas_defaults_to_empty(generated_models):
+    # No generated datasets expected
+    assert generated_models['m_noschemas'].generated == {}
+
+
+def test_schemas_by_name_indexes_model_schemas(generated_models):
+    model = generated_models['m1']
+    assert set(model.schemas_by_name) == {'base', 'child'}
+    assert model.schemas_by_name['base'] is model.model.schemas[0]
+    assert generated_models['m_noschemas'].schemas_by_name == {}
+
+
+def test_ref_generation_large_row_count():
     models = [
         {
             'name': 'm1',
             'locales': ['en-US'],
             'schemas': [
                 {
-                    'name': 'empty',
-                    'rows': 0,
+                    'name': 'base',
+                    'rows': 5,
                     'attributes': [
                         {'name': 'id', 'type': 'random_int', 'params': {'min': 1, 'max': 9}},
                     ],
                 },
+                {
+                    'name': 'child',
+                    'rows': 100000,
+                    'attributes': [
+                        {'name': 'parent_id', 'type': '${ref}', 'params': {'dataset': 'base', 'attribute': 'id'}},
+                    ],
+                },
             ],
         }
     ]
 
     mmf = MultiModelsFaker(models)
     mmf.generate_all()
-    df = mmf.models['m1'].generated['empty']
-    assert isinstance(df, pd.DataFrame)
-    assert len(df) == 0
-
-
-def test_model_without_schemas_defaults_to_empty():
-    models = [
-        {
-            'name': 'm1',
-            'locales': ['en-US'],
-            # 'schemas' key intentionally omitted
-        }
-    ]
-
-    mmf = MultiModelsFaker(models)
-    mmf.generate_all()
-    # No generated datasets expected
-    assert mmf.models['m1'].generated == {}
 
+    model = mmf.models['m1']
+    child_df = model.generated['child']
+    assert len(child_df) == 100000
+    assert child_df['parent_id'].dtype == model.generated['base']['id'].dtype
+    assert set(child_df['parent_id'].unique()).issubset(set(model.generated['base']['id']))
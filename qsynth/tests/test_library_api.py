@@ -1,5 +1,4 @@
 """Tests for programmatic qsynth library API."""
-import pandas as pd
 from pathlib import Path
 import pytest
 from tempfile import TemporaryDirectory
@@ -147,9 +146,10 @@ class TestProgrammaticExperiments:
         # Verify output
         output_file = output_dir / "data.csv"
         assert output_file.exists()
-        df = pd.read_csv(output_file)
-        assert len(df) == 5
-        assert "id" in df.columns
+        # Header line plus one line per row; no need to parse with pandas
+        header, *rows = output_file.read_text().splitlines()
+        assert len(rows) == 5
+        assert "id" in header.split(",")
     
     def test_run_parquet_experiment_programmatically(self, tmp_path):
         """Test running Parquet experiment without YAML file."""
@@ -182,8 +182,9 @@ class TestProgrammaticExperiments:
         
         output_file = output_dir / "data.parquet"
         assert output_file.exists()
-        df = pd.read_parquet(output_file)
-        assert len(df) == 3
+        # Row count from the footer metadata, without materializing the table
+        import pyarrow.parquet as pq
+        assert pq.read_metadata(output_file).num_rows == 3
 
 
 class TestExperimentsClassProgrammatic:
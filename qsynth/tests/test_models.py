@@ -8,6 +8,7 @@ from qsynth.models import (
     Model,
     RowSpec,
     Schema,
+    parse_models,
 )
 
 
@@ -55,54 +56,38 @@ def test_rowspec_rejects_invalid_range():
     assert "min" in str(exc_info.value).lower()
 
 
-def test_schema_parses_int_rows():
-    """Test schema with integer row count."""
+@pytest.mark.parametrize("rows, expected", [
+    (100, 100),
+    ({"min": 10, "max": 100}, RowSpec(min=10, max=100)),
+])
+def test_schema_parses_rows(rows, expected):
+    """Test schema with integer row count or dict row spec."""
     schema = Schema(
         name="users",
-        rows=100,
+        rows=rows,
         attributes=[
             Attribute(name="id", type="random_int")
         ]
     )
-    assert schema.rows == 100
+    assert type(schema.rows) is type(expected)
+    assert schema.rows == expected
 
 
-def test_schema_parses_dict_rows():
-    """Test schema with dict row spec."""
-    schema = Schema(
-        name="users",
-        rows={"min": 10, "max": 100},
-        attributes=[
-            Attribute(name="id", type="random_int")
-        ]
-    )
-    assert isinstance(schema.rows, RowSpec)
-    assert schema.rows.min == 10
-    assert schema.rows.max == 100
-
-
-def test_model_parses_single_locale():
-    """Test model with string locale."""
+@pytest.mark.parametrize("locales, expected", [
+    ("en-US", "en-US"),
+    # Model preserves list locales
+    (["en-US", "fr-FR"], ["en-US", "fr-FR"]),
+])
+def test_model_parses_locale(locales, expected):
+    """Test model with string or list locale."""
     model = Model(
         name="test",
-        locales="en-US",
+        locales=locales,
         schemas=[
             Schema(name="s1", rows=10, attributes=[Attribute(name="id", type="random_int")])
         ]
     )
-    assert model.locales == "en-US"
-
-
-def test_model_parses_list_locale():
-    """Test model with list locale (preserved as list)."""
-    model = Model(
-        name="test",
-        locales=["en-US", "fr-FR"],
-        schemas=[]
-    )
-    # Model preserves list locales
-    assert isinstance(model.locales, list)
-    assert model.locales == ["en-US", "fr-FR"]
+    assert model.locales == expected
 
 
 def test_model_defaults_locale():
@@ -133,9 +118,26 @@ def test_full_model_from_dict():
             }
         ]
     }
-    model = Model(**model_dict)
+    model = Model.model_validate(model_dict)
     assert model.name == "testmodel"
     assert len(model.schemas) == 1
     assert len(model.schemas[0].attributes) == 2
     assert model.schemas[0].attributes[0].params.min == 1
 
+
+def test_parse_models_batch():
+    """Test a mixed list of dicts and Model instances validates in one batch."""
+    existing = Model(name="existing", schemas=[])
+    models = parse_models([
+        {"name": "m1", "schemas": [{"name": "d1", "rows": 5, "attributes": [{"name": "id", "type": "random_int"}]}]},
+        existing,
+    ])
+    assert [m.name for m in models] == ["m1", "existing"]
+    assert models[0].schemas[0].attributes[0].name == "id"
+    assert models[1] is existing
+
+
+def test_parse_models_invalid():
+    """Test batch validation reports invalid entries."""
+    with pytest.raises(ValidationError):
+        parse_models([{"name": "bad", "schemas": [{"name": "d1", "rows": {"min": 10, "max": 1}, "attributes": []}]}])
@@ -3,6 +3,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from qsynth import config
 from qsynth.repl import QsynthRepl
 
 
@@ -38,6 +39,52 @@ experiments:
     assert repl.running
 
 
+def test_repl_loads_config_lazily(tmp_path):
+    """Test REPL parses the YAML file only when the config is first needed."""
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_text("models: []\nexperiments:\n  write_csv:\n    type: csv\n")
+    
+    repl = QsynthRepl(str(yaml_file))
+    assert 'config' not in repl.__dict__
+    
+    assert list(repl.experiments) == ['write_csv']
+    assert 'config' in repl.__dict__
+
+
+def test_repl_reuses_parsed_config(tmp_path):
+    """Test REPLs on an unchanged file share one parse but own their config copies."""
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_text("models: []\nexperiments:\n  write_csv:\n    type: csv\n")
+    
+    with patch.object(config, 'load_yaml', wraps=config.load_yaml) as parse:
+        first = QsynthRepl(str(yaml_file))
+        second = QsynthRepl(str(yaml_file))
+        first.experiments['extra'] = {'type': 'csv'}
+        assert list(second.experiments) == ['write_csv']
+        assert parse.call_count == 1
+        
+        yaml_file.write_text("models: []\nexperiments:\n  write_sql:\n    type: sql\n")
+        assert list(QsynthRepl(str(yaml_file)).experiments) == ['write_sql']
+        assert parse.call_count == 2
+
+
+def test_repl_config_does_not_import_main(tmp_path):
+    """Test loading the REPL config leaves pandas and Faker unimported."""
+    import subprocess
+    import sys
+    
+    yaml_file = tmp_path / "test.yaml"
+    yaml_file.write_text("models: []\nexperiments: {}\n")
+    code = (
+        "import sys\n"
+        "from qsynth.repl import QsynthRepl\n"
+        f"QsynthRepl({str(yaml_file)!r}).config\n"
+        "assert 'qsynth.main' not in sys.modules\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_repl_initialization_nonexistent_file():
     """Test REPL raises error for nonexistent file."""
     with pytest.raises(FileNotFoundError):
@@ -241,3 +288,262 @@ experiments: {}
     # Should print an error message
     assert console.print.call_count > 0
 
+
+
+def _complete(repl, text):
+    """Return completion texts for the given input line."""
+    from prompt_toolkit.document import Document
+    return [c.text for c in repl.completer.get_completions(Document(text), None)]
+
+
+def test_repl_completes_faker_types_by_prefix():
+    """Test faker type completion returns prefix matches only when available."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    completions = _complete(repl, "info random_")
+    assert 'random_int' in completions
+    assert all(c.startswith('random_') for c in completions)
+    
+    # Case-insensitive prefix match
+    assert 'random_int' in _complete(repl, "test RANDOM_I")
+
+
+def test_repl_completes_faker_types_by_substring():
+    """Test faker type completion falls back to substring matches."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    completions = _complete(repl, "types --find andom_in")
+    assert 'random_int' in completions
+    assert _complete(repl, "info zzz_no_such_type") == []
+    # A single character is matched by prefix only
+    assert _complete(repl, "info q") == []
+
+
+def test_repl_completes_experiment_names():
+    """Test run completion prefers prefix matches and falls back to substrings."""
+    yaml_file = Path(__file__).parent.parent.parent / "moneta.yaml"
+    if not yaml_file.exists():
+        pytest.skip("moneta.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    completions = _complete(repl, "run write_model")
+    assert completions == sorted(completions)
+    assert completions and all(c.startswith('write_model') for c in completions)
+    assert _complete(repl, "run CSV") == ['write_csv']
+    assert _complete(repl, "run no_such_experiment") == []
+
+
+def test_repl_completion_caps_faker_types():
+    """Test faker type completion yields at most max_results items."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    assert len(_complete(repl, "info ")) == repl.completer.max_results
+    repl.completer.max_results = 5
+    assert len(_complete(repl, "info ")) == 5
+
+
+def test_repl_cmd_test_uses_defaults():
+    """Test the test command generates samples with default parameters and caches the signature."""
+    from qsynth.repl import _method_parameters
+    
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    console = MagicMock()
+    session = MagicMock()
+    session.prompt.return_value = ""
+    
+    repl._cmd_test(console, ['random_int'], session)
+    printed = " ".join(str(call.args[0]) for call in console.print.call_args_list if call.args)
+    assert "Testing type" in printed
+    assert "Error" not in printed
+    
+    hits = _method_parameters.cache_info().hits
+    repl._cmd_test(console, ['random_int'], session)
+    assert _method_parameters.cache_info().hits == hits + 1
+
+
+def test_repl_completes_schema_names_by_model(tmp_path):
+    """Test schema completion is scoped to the model and deduplicated across models."""
+    yaml_content = """
+models:
+  - name: sales
+    locales: ['en-US']
+    schemas:
+      - name: orders
+        rows: 10
+        attributes:
+          - name: id
+            type: random_int
+      - name: customers
+        rows: 10
+        attributes:
+          - name: id
+            type: random_int
+  - name: hr
+    locales: ['en-US']
+    schemas:
+      - name: customers
+        rows: 10
+        attributes:
+          - name: id
+            type: random_int
+
+experiments: {}
+"""
+    yaml_file = tmp_path / "test_schemas.yaml"
+    yaml_file.write_text(yaml_content)
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    assert _complete(repl, "preview sales ") == ['customers', 'orders']
+    assert _complete(repl, "preview hr ") == ['customers']
+    assert _complete(repl, "preview nosuchmodel ") == []
+    assert _complete(repl, "describe schema ") == ['customers', 'orders']
+
+
+def test_repl_format_yaml_value():
+    """Test values are rendered as YAML scalars, quoting strings with special characters."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    assert repl._format_yaml_value("plain") == "plain"
+    assert repl._format_yaml_value("-30y") == '"-30y"'
+    assert repl._format_yaml_value("a b") == '"a b"'
+    assert repl._format_yaml_value(True) == "true"
+    assert repl._format_yaml_value(5) == "5"
+    assert repl._format_yaml_value(None) == "null"
+    assert repl._format_yaml_value(["x", "y:z", 1]) == '[x, "y:z", 1]'
+
+
+def test_repl_parse_parameter_value():
+    """Test prompt values are converted according to the parameter annotation."""
+    import inspect
+    from typing import Optional, Union
+    
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    
+    assert repl._parse_parameter_value("5", int) == 5
+    assert repl._parse_parameter_value("1.5", float) == 1.5
+    assert repl._parse_parameter_value("yes", bool) is True
+    assert repl._parse_parameter_value("5", str) == "5"
+    assert repl._parse_parameter_value("5", Optional[int]) == 5
+    assert repl._parse_parameter_value("1.5", Union[float, int, None]) == 1.5
+    assert repl._parse_parameter_value("-30y", Union[int, str]) == "-30y"
+    assert repl._parse_parameter_value("7", "int") == 7
+    assert repl._parse_parameter_value("7", inspect.Parameter.empty) == 7
+    assert repl._parse_parameter_value("abc", inspect.Parameter.empty) == "abc"
+    assert repl._parse_parameter_value("-3", inspect.Parameter.empty) == -3
+    assert repl._parse_parameter_value("2.5", inspect.Parameter.empty) == 2.5
+    assert repl._parse_parameter_value("1.2.3", inspect.Parameter.empty) == "1.2.3"
+    with pytest.raises(ValueError):
+        repl._parse_parameter_value("abc", Optional[int])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("42", 42),
+    ("-3", -3),
+    ("2.5", 2.5),
+    ("1_000", 1000),
+    (" 42 ", 42),
+    ("1.5e3", 1500.0),
+    ("\u0663", 3),
+    ("1e3", "1e3"),
+    ("inf", "inf"),
+    ("nan", "nan"),
+    ("1.2.3", "1.2.3"),
+])
+def test_infer_value_matches_int_float_parsing(text, expected):
+    """Test untyped prompt values parse as int() (no '.') or float(), else stay strings."""
+    from qsynth.repl import _infer_value
+    
+    value = _infer_value(text)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_repl_cmd_test_escapes_markup_in_samples():
+    """Test sample values that look like Rich markup are shown literally."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    console = MagicMock()
+    session = MagicMock()
+    session.prompt.side_effect = ["[bold]#", ""]  # text, letters
+    
+    repl._cmd_test(console, ['bothify'], session)
+    
+    table = next(call.args[0] for call in console.print.call_args_list
+                 if call.args and type(call.args[0]).__name__ == 'Table')
+    values = list(table.columns[1].cells)
+    assert len(values) == 10
+    assert all(value.startswith('\\[bold]') for value in values)
+
+
+def test_repl_cmd_test_prints_yaml_snippet():
+    """Test the test command prints a YAML attribute snippet with the chosen params."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    console = MagicMock()
+    session = MagicMock()
+    session.prompt.side_effect = ["1", "5", ""]  # min, max, step
+    
+    repl._cmd_test(console, ['random_int'], session)
+    
+    syntax = next(call.args[0] for call in console.print.call_args_list
+                  if call.args and type(call.args[0]).__name__ == 'Syntax')
+    assert syntax.code == (
+        "- name: attribute_name\n"
+        "  type: random_int\n"
+        "  params:\n"
+        "    max: 5\n"
+        "    min: 1\n"
+        "    step: 1"
+    )
+
+
+def test_repl_cmd_test_reports_sampling_error_once():
+    """Test a failing type is reported in a single error row instead of ten."""
+    yaml_file = Path(__file__).parent.parent.parent / "models.yaml"
+    if not yaml_file.exists():
+        pytest.skip("models.yaml not found")
+    
+    repl = QsynthRepl(str(yaml_file))
+    console = MagicMock()
+    session = MagicMock()
+    session.prompt.side_effect = ["10", "1", ""]  # min > max, then step
+    
+    repl._cmd_test(console, ['random_int'], session)
+    
+    table = next(call.args[0] for call in console.print.call_args_list
+                 if call.args and type(call.args[0]).__name__ == 'Table')
+    values = list(table.columns[1].cells)
+    assert len(values) == 1
+    assert values[0].startswith("[red]Error:")
@@ -1,11 +1,16 @@
 """Tests for all writer classes."""
+import csv
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import os
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
 from qsynth.models import Model, Schema, Attribute
 from qsynth.main import MultiModelsFaker
-from qsynth.writers import get_writer
+from qsynth.writers import get_writer, write_all
+from qsynth.writers.base import Writer
 from qsynth.writers.csv_writer import CsvWriter
 from qsynth.writers.parquet_writer import ParquetWriter
 from qsynth.writers.avro_writer import AvroWriter
@@ -16,8 +21,8 @@ from qsynth.writers.meta_writer import MetaDescriptorWriter
 from qsynth.writers.llm_prompt_writer import LLMPromptWriter
 
 
-# Test output directory - use real directory structure
-TEST_OUTPUT_BASE = Path(__file__).parent.parent.parent / ".test-data" / ".ut"
+# Test output directory - use real directory structure; one subdirectory per xdist worker
+TEST_OUTPUT_BASE = Path(__file__).parent.parent.parent / ".test-data" / ".ut" / os.environ.get("PYTEST_XDIST_WORKER", "")
 
 
 def create_test_model():
@@ -55,11 +60,18 @@ def generate_test_data(model):
     return mmf.models[model.name]
 
 
-@pytest.fixture
-def test_output_dir():
-    """Create test output directory in .test-data/.ut/writers."""
+@pytest.fixture(scope="module")
+def writers_output_base():
+    """Create the .test-data/.ut/writers directory once for the module."""
     output_dir = TEST_OUTPUT_BASE / "writers"
     output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+@pytest.fixture
+def test_output_dir(writers_output_base):
+    """Test output directory in .test-data/.ut/writers, emptied after each test."""
+    output_dir = writers_output_base
     yield output_dir
     # Cleanup: remove test files after each test
     for file in output_dir.glob("*"):
@@ -90,6 +102,26 @@ class TestCsvWriter:
         assert output_path.exists()
         content = output_path.read_text()
         assert "id" in content or "name" in content
+    
+    @pytest.mark.parametrize("params", [
+        {"engine": "pyarrow", "sep": ";", "index": False},
+        # index left at the pandas default falls back to to_csv
+        {"engine": "pyarrow", "sep": ";"},
+    ])
+    def test_csv_writer_pyarrow_engine(self, test_output_dir, params):
+        """Test the pyarrow CSV engine writes the same rows as pandas."""
+        model = create_test_model()
+        model_faker = generate_test_data(model)
+        data = model_faker.generated["users"]
+        
+        writer = CsvWriter()
+        output_path = test_output_dir / "users_arrow.csv"
+        writer.write(output_path, data, "test_model", "users", model_faker, params)
+        
+        with open(output_path, newline="") as f:
+            header, *rows = csv.reader(f, delimiter=";")
+        assert header[-3:] == ["id", "name", "email"]
+        assert [row[-2:] for row in rows] == data[["name", "email"]].values.tolist()
 
 
 class TestParquetWriter:
@@ -116,6 +148,25 @@ class TestParquetWriter:
         df = pd.read_parquet(output_path)
         assert len(df) == 5
         assert "id" in df.columns
+    
+    def test_parquet_writer_small_write_buffer(self, test_output_dir):
+        """Test Parquet output is intact when the write buffer is smaller than the file."""
+        model_faker = generate_test_data(create_test_model())
+        data = pd.DataFrame({"id": range(10000), "name": ["n"] * 10000})
+        
+        output_path = test_output_dir / "buffered.parquet"
+        ParquetWriter().write(output_path, data, "test_model", "users", model_faker, {"write_buffer_size": 1024})
+        
+        pd.testing.assert_frame_equal(pd.read_parquet(output_path), data)
+    
+    def test_parquet_writer_passes_path_to_other_engines(self, test_output_dir):
+        """Test non-pyarrow engines get the output path rather than an Arrow sink."""
+        data = pd.DataFrame({"x": [1, 2]})
+        output_path = test_output_dir / "engine.parquet"
+        
+        with patch.object(pd.DataFrame, "to_parquet") as to_parquet:
+            ParquetWriter().write(output_path, data, "m", "t", None, {"engine": "fastparquet"})
+        to_parquet.assert_called_once_with(output_path, engine="fastparquet")
 
 
 class TestAvroWriter:
@@ -138,6 +189,47 @@ class TestAvroWriter:
         writer.finalize_writer()
         
         assert output_path.exists()
+    
+    @pytest.mark.parametrize("times_as_micros", [True, False])
+    def test_avro_writer_round_trips_values(self, test_output_dir, times_as_micros):
+        """Test Avro writer output reads back with the same values and schema as pandavro."""
+        import fastavro
+        import pandavro
+        
+        model_faker = generate_test_data(create_test_model())
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["a", "b"],
+            "when": pd.to_datetime(["2024-01-02 03:04:05.123", "2024-02-03 00:00:00.000"]),
+        })
+        
+        writer = AvroWriter()
+        output_path = test_output_dir / "users_values.avro"
+        writer.write(output_path, data, "test_model", "users", model_faker, {"times_as_micros": times_as_micros})
+        
+        with open(output_path, "rb") as f:
+            reader = fastavro.reader(f)
+            records = list(reader)
+            assert reader.writer_schema == pandavro.schema_infer(data, times_as_micros)
+        assert [r["id"] for r in records] == [1, 2]
+        assert [r["name"] for r in records] == ["a", "b"]
+        assert [r["when"].replace(tzinfo=None) for r in records] == data["when"].tolist()
+
+    def test_avro_writer_same_dataset_name_in_two_models(self, test_output_dir):
+        """Test datasets sharing a name across models each get their own schema."""
+        import fastavro
+        
+        model_faker = generate_test_data(create_test_model())
+        writer = AvroWriter()
+        a_path = test_output_dir / "a_t.avro"
+        b_path = test_output_dir / "b_t.avro"
+        writer.write(a_path, pd.DataFrame({"x": [1, 2]}), "a", "t", model_faker)
+        writer.write(b_path, pd.DataFrame({"y": ["p", "q"]}), "b", "t", model_faker)
+        
+        with open(a_path, "rb") as f:
+            assert list(fastavro.reader(f)) == [{"x": 1}, {"x": 2}]
+        with open(b_path, "rb") as f:
+            assert list(fastavro.reader(f)) == [{"y": "p"}, {"y": "q"}]
 
 
 class TestSqlWriter:
@@ -161,10 +253,115 @@ class TestSqlWriter:
         
         assert output_path.exists()
         content = output_path.read_text()
-        assert "CREATE TABLE" in content.upper()
-        assert "INSERT INTO" in content.upper()
+        upper = content.upper()
+        assert "CREATE TABLE" in upper
+        assert "INSERT INTO" in upper
         assert "users" in content
 
+    def test_sql_writer_encodes_values(self, test_output_dir):
+        """Test SQL writer quotes and escapes strings and renders numbers as-is."""
+        model = create_test_model()
+        model_faker = generate_test_data(model)
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["O'Brien", "Ann"],
+            "email": ["a@x.org", "b@x.org"],
+        })
+        
+        writer = SqlWriter()
+        output_path = test_output_dir / "users_values.sql"
+        writer.init_writer(output_path)
+        writer.write(output_path, data, "test_model", "users", model_faker)
+        writer.finalize_writer()
+        
+        content = output_path.read_text()
+        assert ("INSERT INTO users (id,name,email) VALUES\n"
+                "(1,'O''Brien','a@x.org'),\n"
+                "(2,'Ann','b@x.org');") in content
+    
+    def test_sql_writer_batches_inserts(self, test_output_dir):
+        """Test SQL writer splits rows into multi-row INSERTs of batch_size rows."""
+        model = create_test_model()
+        model_faker = generate_test_data(model)
+        data = pd.DataFrame({"id": range(5), "name": ["n"] * 5, "email": ["e"] * 5})
+        
+        writer = SqlWriter()
+        output_path = test_output_dir / "users_batches.sql"
+        writer.init_writer(output_path)
+        writer.write(output_path, data, "test_model", "users", model_faker, {"batch_size": 2})
+        writer.finalize_writer()
+        
+        content = output_path.read_text()
+        assert content.count("INSERT INTO users") == 3
+        assert content.endswith("(4,'n','e');\n")
+    
+    def test_sql_writer_renders_missing_dates_as_null(self, test_output_dir):
+        """Test SQL writer renders NaT dates as NULL."""
+        model_faker = generate_test_data(create_test_model())
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["a", "b"],
+            "email": pd.to_datetime(["2023-01-02", None]),
+        })
+        
+        writer = SqlWriter()
+        output_path = test_output_dir / "users_dates.sql"
+        writer.write(output_path, data, "test_model", "users", model_faker)
+        writer.finalize_writer()
+        
+        assert "(1,'a','2023-01-02'),\n(2,'b',NULL);" in output_path.read_text()
+    
+    def test_sql_writer_script_runs_with_missing_dates(self, test_output_dir):
+        """Test the generated script loads into sqlite3 when a date column has NaT."""
+        import sqlite3
+        
+        model_faker = generate_test_data(create_test_model())
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["a", "b"],
+            "email": pd.to_datetime(["2023-01-02", None]),
+        })
+        
+        writer = SqlWriter()
+        output_path = test_output_dir / "users_sqlite.sql"
+        writer.write(output_path, data, "test_model", "users", model_faker)
+        writer.finalize_writer()
+        
+        # The "//" dataset banner lines are not SQL
+        script = "".join(line for line in output_path.read_text().splitlines(True)
+                         if not line.startswith("//"))
+        with sqlite3.connect(":memory:") as conn:
+            conn.executescript(script)
+            rows = conn.execute("SELECT id, name, email FROM users ORDER BY id").fetchall()
+        assert rows == [(1, "a", "2023-01-02"), (2, "b", None)]
+    
+    @pytest.mark.parametrize("batch_size", [0, -1, 2.5, "10"])
+    def test_sql_writer_rejects_invalid_batch_size(self, test_output_dir, batch_size):
+        """Test SQL writer raises ValueError for a batch_size that is not a positive integer."""
+        model_faker = generate_test_data(create_test_model())
+        
+        writer = SqlWriter()
+        with pytest.raises(ValueError, match="batch_size"):
+            writer.write(test_output_dir / "users_bad.sql", model_faker.generated["users"],
+                         "test_model", "users", model_faker, {"batch_size": batch_size})
+    
+    def test_sql_writer_streams_each_path(self, test_output_dir):
+        """Test SQL writer writes each dataset to its own output path."""
+        model = create_test_model()
+        model_faker = generate_test_data(model)
+        
+        writer = SqlWriter()
+        users_path = test_output_dir / "stream_users.sql"
+        orders_path = test_output_dir / "stream_orders.sql"
+        writer.init_writer(users_path)
+        writer.write(users_path, model_faker.generated["users"], "test_model", "users", model_faker)
+        writer.write(orders_path, model_faker.generated["orders"], "test_model", "orders", model_faker)
+        writer.finalize_writer()
+        
+        assert "CREATE TABLE users" in users_path.read_text()
+        assert "CREATE TABLE orders" not in users_path.read_text()
+        assert "CREATE TABLE orders" in orders_path.read_text()
+
 
 class TestErModelWriter:
     def test_ermodel_writer_creates_file(self, test_output_dir):
@@ -199,6 +396,20 @@ class TestErModelWriter:
         assert "entity" in content.lower()
         assert "users" in content or "Users" in content
 
+    def test_ermodel_writer_closes_files_when_write_fails(self, test_output_dir):
+        """Test a failing write closes the open output files."""
+        model_faker = generate_test_data(create_test_model())
+        
+        writer = ErModelWriter()
+        output_path = test_output_dir / "model.puml"
+        writer.write(output_path, model_faker.generated["users"], "test_model", "users", model_faker)
+        tf = writer._files[output_path]
+        with pytest.raises(AttributeError):
+            writer.write(output_path, None, "test_model", "orders", model_faker)
+        
+        assert tf.closed
+        assert writer._files == {}
+
 
 class TestMermaidWriter:
     def test_mermaid_writer_creates_file(self, test_output_dir):
@@ -302,6 +513,69 @@ class TestLLMPromptWriter:
         assert "Relations:" in content
 
 
+class TestEnsurePath:
+    def test_ensure_path_creates_parent_once_and_removes_existing_file(self, tmp_path):
+        """Test writers create missing parents once and clear a previous output file."""
+        writer = CsvWriter()
+        output_path = tmp_path / "nested" / "dir" / "out.csv"
+        
+        writer._ensure_path(output_path)
+        assert output_path.parent.is_dir()
+        
+        output_path.write_text("old")
+        writer._ensure_path(output_path)
+        assert not output_path.exists()
+        
+        with patch.object(Path, "mkdir") as mkdir:
+            writer._ensure_path(output_path.parent / "other.csv")
+        mkdir.assert_not_called()
+    
+    def test_ensure_path_is_static(self, tmp_path):
+        """Test Writer.ensure_path still works called on the class, as custom writers do."""
+        output_path = tmp_path / "custom" / "out.csv"
+        
+        Writer.ensure_path(output_path)
+        assert output_path.parent.is_dir()
+        
+        output_path.write_text("old")
+        Writer.ensure_path(output_path)
+        assert not output_path.exists()
+
+
+class TestWriteAll:
+    def test_write_all_parallel_stateless_writers(self, test_output_dir):
+        """Test write_all writes every dataset of a thread-safe writer."""
+        model_faker = generate_test_data(create_test_model())
+        writer = CsvWriter()
+        tasks = [
+            (writer, test_output_dir / f"all_{name}.csv", df, "test_model", name, model_faker, {"index": False})
+            for name, df in model_faker.generated.items()
+        ]
+        
+        with patch("qsynth.writers.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            write_all(tasks)
+        pool.assert_called_once()
+        for name, df in model_faker.generated.items():
+            assert len((test_output_dir / f"all_{name}.csv").read_text().splitlines()) == len(df) + 1
+    
+    def test_write_all_keeps_stateful_writers_serial(self, test_output_dir):
+        """Test write_all runs stateful writers in order on the calling thread."""
+        model_faker = generate_test_data(create_test_model())
+        writer = SqlWriter()
+        output_path = test_output_dir / "all.sql"
+        tasks = [
+            (writer, output_path, df, "test_model", name, model_faker, {})
+            for name, df in model_faker.generated.items()
+        ]
+        
+        with patch("qsynth.writers.ThreadPoolExecutor") as pool:
+            write_all(tasks)
+            writer.finalize_writer()
+        pool.assert_not_called()
+        content = output_path.read_text()
+        assert content.index("CREATE TABLE users") < content.index("CREATE TABLE orders")
+
+
 class TestWriterRegistry:
     def test_registry_get_csv_writer(self):
         """Test registry returns CSV writer."""
@@ -323,6 +597,19 @@ class TestWriterRegistry:
         writer = get_writer('sql')
         assert isinstance(writer, SqlWriter)
     
+    def test_registry_registers_writers_without_experiments(self):
+        """Test importing qsynth.writers alone registers the built-in writers."""
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys\n"
+            "from qsynth.writers import get_writer\n"
+            "get_writer('csv')\n"
+            "assert 'qsynth.experiments' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
     def test_registry_raises_on_unknown(self):
         """Test registry raises error for unknown writer."""
         with pytest.raises(Exception, match="Unknown writer"):
@@ -1,9 +1,11 @@
 """Writers package with registry for output formats."""
-from typing import Dict, Type
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
 
 
 class WriterRegistry:
-    _registry: Dict[str, type] = {}
+    # Writer factories by name; registered classes are their own factories
+    _registry: Dict[str, Callable] = {}
 
     @classmethod
     def register(cls, name: str):
@@ -14,10 +16,10 @@ class WriterRegistry:
 
     @classmethod
     def get(cls, name: str):
-        w = cls._registry.get(name)
-        if not w:
-            raise Exception(f"Unknown writer '{name}'")
-        return w
+        try:
+            return cls._registry[name]
+        except KeyError:
+            raise Exception(f"Unknown writer '{name}'") from None
 
 
 def register_writer(name: str):
@@ -28,3 +30,27 @@ def get_writer(name: str):
     return WriterRegistry.get(name)()
 
 
+def write_all(tasks, max_workers=None):
+    """Run (writer, path, *write args) tasks, in threads when every writer is thread safe."""
+    tasks = list(tasks)
+    # Parallel only for stateless writers writing distinct files
+    if (len(tasks) > 1 and all(t[0].thread_safe for t in tasks)
+            and len({str(t[1]) for t in tasks}) == len(tasks)):
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(lambda t: t[0].write(*t[1:]), tasks))
+    else:
+        for writer, *args in tasks:
+            writer.write(*args)
+
+
+# Import all writer modules to trigger registration
+from qsynth.writers import (  # noqa: E402
+    csv_writer,
+    parquet_writer,
+    avro_writer,
+    sql_writer,
+    ermodel_writer,
+    mermaid_writer,
+    llm_prompt_writer,
+    meta_writer,
+)
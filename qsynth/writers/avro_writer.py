@@ -1,17 +1,48 @@
 from pandas import DataFrame
-import pandavro
 
-from qsynth.writers.base import Writer
+from qsynth.writers.base import DEFAULT_WRITE_BUFFER_SIZE, Writer
 from qsynth.writers import register_writer
 
 
 @register_writer('avro')
 class AvroWriter(Writer):
+    thread_safe = True
+
+    def __init__(self):
+        # Parsed Avro schemas by model, dataset and column signature, inferred on first write
+        self._schemas = {}
+
     def init_writer(self, init_path):
         print(f"Init Avro writer on {init_path}")
 
-    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        Writer.ensure_path(path)
-        pandavro.to_avro(path, pd, **writeparams)
-
+    def _schema(self, model_name, schema_name, pd, times_as_micros):
+        # Column names and dtypes are part of the key so a same-named dataset of another
+        # model (or a changed frame) never reuses a schema inferred for different columns
+        key = (model_name, schema_name, tuple(zip(pd.columns, pd.dtypes.values)), times_as_micros)
+        schema = self._schemas.get(key)
+        if schema is None:
+            import fastavro
+            import pandavro
+            schema = self._schemas[key] = fastavro.parse_schema(pandavro.schema_infer(pd, times_as_micros))
+        return schema
 
+    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
+        import fastavro
+        self._ensure_path(path)
+        params = dict(writeparams)
+        schema = params.pop('schema', None)
+        append = params.pop('append', False)
+        times_as_micros = params.pop('times_as_micros', True)
+        buffer_size = params.pop('write_buffer_size', DEFAULT_WRITE_BUFFER_SIZE)
+        if schema is None:
+            schema = self._schema(model_name, schema_name, pd, times_as_micros)
+        columns = list(pd.columns)
+        # Timestamps go in as epoch integers, which fastavro writes without per-value datetime math
+        unit = 'us' if times_as_micros else 'ms'
+        values = [col.to_numpy(f'datetime64[{unit}]').astype('int64').tolist()
+                  if col.dtype.kind == 'M' and not col.hasnans else col.tolist()
+                  for _, col in pd.items()]
+        # Rows are streamed to fastavro; the frame is never copied into a list of dicts
+        records = (dict(zip(columns, row)) for row in zip(*values))
+        with open(path, 'wb' if not append else 'a+b', buffering=buffer_size) as f:
+            fastavro.writer(f, schema, records, **params)
@@ -1,10 +1,34 @@
 from abc import abstractmethod
-import os
+import functools
 import re
+from pathlib import Path
 from pandas import DataFrame
 
+# Parenthetical annotations such as "(nullable)" in type names
+_TYPE_ANNOT_RE = re.compile(r"\([^)]+\)")
+
+# Output buffer for binary file writers, overridable with the write_buffer_size param
+DEFAULT_WRITE_BUFFER_SIZE = 4 << 20
+
+# SQL column types by numpy dtype kind
+_SQL_KIND = {
+    'i': 'INT',
+    'O': 'VARCHAR',
+    'f': 'DECIMAL(15,4)',
+    'M': 'DATE',
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _clean_type_name(s: str) -> str:
+    return _TYPE_ANNOT_RE.sub('', s.lower())
+
 
 class Writer:
+    # Stateless writers whose write() calls may run concurrently on distinct paths
+    thread_safe = False
+    # Parent directories already created by this writer, set on first use
+    _ensured_dirs = None
 
     @abstractmethod
     def init_writer(self, init_path):
@@ -12,6 +36,7 @@ class Writer:
 
     @abstractmethod
     def finalize_writer(self):
+        """Flush and close all output; callers must invoke it once done writing, also after a failed write."""
         print(f"Finalize writer on")
 
     @abstractmethod
@@ -20,31 +45,35 @@ class Writer:
 
     @staticmethod
     def ensure_path(path):
-        if os.path.exists(path):
-            os.remove(path)
-        else:
-            if not os.path.exists(path.parent):
-                os.makedirs(path.parent)
+        """Remove an existing output file, or create its parent directory."""
+        path = Path(path)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _ensure_path(self, path):
+        """Like ensure_path, but creates each parent directory at most once per writer."""
+        path = Path(path)
+        if self._ensured_dirs is None:
+            self._ensured_dirs = set()
+        if path.parent in self._ensured_dirs:
+            path.unlink(missing_ok=True)
+            return
+        Writer.ensure_path(path)
+        self._ensured_dirs.add(path.parent)
 
     @staticmethod
     def clean_type_name(s):
         """Clean type name by removing parenthetical annotations."""
-        typec = r"\([^)]+\)"
-        return re.sub(typec, '', str(s).lower())
+        return _clean_type_name(str(s))
 
     @staticmethod
     def to_sql_type(dk):
         """Convert numpy dtype kind to SQL type."""
-        match dk:
-            case 'i':
-                return 'INT'
-            case 'O':
-                return 'VARCHAR'
-            case 'f':
-                return 'DECIMAL(15,4)'
-            case 'M':
-                return 'DATE'
-            case _:
-                raise Exception(f"Unknown type kind {dk}")
+        try:
+            return _SQL_KIND[dk]
+        except KeyError:
+            raise Exception(f"Unknown type kind {dk}") from None
 
 
@@ -4,13 +4,34 @@ from qsynth.writers.base import Writer
 from qsynth.writers import register_writer
 
 
+# to_csv options the Arrow CSV writer can honour
+_ARROW_CSV_PARAMS = {'engine', 'sep', 'header', 'index'}
+
+
 @register_writer('csv')
 class CsvWriter(Writer):
+    thread_safe = True
+
     def init_writer(self, init_path):
         print(f"Init CSV writer on {init_path}")
 
+    @staticmethod
+    def _use_arrow(writeparams):
+        return (writeparams.get('engine') == 'pyarrow'
+                and writeparams.keys() <= _ARROW_CSV_PARAMS
+                and writeparams.get('index') is False
+                and isinstance(writeparams.get('header', True), bool))
+
     def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        Writer.ensure_path(path)
-        pd.to_csv(path, **writeparams)
+        self._ensure_path(path)
+        if CsvWriter._use_arrow(writeparams):
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
+            options = pacsv.WriteOptions(include_header=writeparams.get('header', True),
+                                         delimiter=writeparams.get('sep', ','))
+            pacsv.write_csv(pa.Table.from_pandas(pd, preserve_index=False), str(path), options)
+            return
+        # Anything Arrow can't express goes through pandas
+        pd.to_csv(path, **{k: v for k, v in writeparams.items() if k != 'engine'})
 
 
@@ -7,32 +7,20 @@ from qsynth.writers import register_writer
 @register_writer('llm-prompt')
 class LLMPromptWriter(Writer):
     def __init__(self):
-        self.last_path = None
-        self.refs = []
-        self.models = {}
-        self.table_descriptions ={}
+        # Open output files by path with the relations to emit when finalizing
+        self._files = {}
+        self.refs = {}
         self.write_params={}
 
     def init_writer(self, init_path):
         pass
 
-    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        self.last_path = path
-        self.write_params.update(writeparams)
-        sc = [schema for schema in model.model.schemas if schema.name == schema_name][0]
-        names = [x.name for x in sc.attributes]
-        types = [str(x.kind) for x in list(pd.dtypes)]
-        descriptions = [x.description for x in sc.attributes]
-        a = list(zip(names, types, descriptions))
-        for at in sc.attributes:
-             if at.type=="${ref}":
-                 self.refs.append({'p': at.params.dataset, 'pa':at.params.attribute,'c' : schema_name, 'ca': at.name, 'cord': (at.params.cord or "1-*")})
-        self.models.update({schema_name:a})
-        self.table_descriptions.update({schema_name: sc.description})
-
-    def finalize_writer(self):
-        Writer.ensure_path(self.last_path)
-        with (open(self.last_path, "w") as tf):
+    def _open(self, path):
+        tf = self._files.get(path)
+        if tf is None:
+            self._ensure_path(path)
+            tf = self._files[path] = open(path, "w", buffering=1 << 20)
+            self.refs[path] = []
             prolog = self.write_params.get('prologue')
             if prolog:
                 tf.write(prolog)
@@ -40,37 +28,62 @@ class LLMPromptWriter(Writer):
                 tf.write("You are SQL bot: Use following database model")
 
             tf.write("\nTables:\n")
-            for k,v in self.models.items():
-                tf.write('\t' + k+ ':')
-                tdesc = self.table_descriptions.get(k)
-                if tdesc:
-                    tf.write(f"- {tdesc}")
-                tf.write('\n')
-                for a in v:
-                    tf.write(f"\t\t- {a[0]}:{a[1]}")
-                    if a[2]:
-                        tf.write(f" - {a[2]}")
-                    tf.write("\n")
-                tf.write("\n")
+        return tf
 
-            tf.write("Relations:\n")
-            for r in self.refs:
-                tf.write('\t' + r['p']+'.'+r['pa'] +f" -({r['cord']})-" + r['c']+'.'+r['ca']+'\n')
+    def _close_all(self):
+        for tf in self._files.values():
+            tf.close()
+        self._files.clear()
+        self.refs.clear()
 
-            rules = self.write_params.get('rules')
-            if (rules):
-                tf.write("\nRules:\n")
-                if (isinstance(rules, str)):
-                    tf.write(f"{rules}\n")
-                if (isinstance(rules, list)):
-                    for v in rules:
-                        formated = str(v).replace('\n', '\n\t\t ')
-                        tf.write(f"\t -{formated}\n")
+    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
+        self.write_params.update(writeparams)
+        sc = model.schemas_by_name[schema_name]
+        # Tables are written as they arrive; relations, rules and epilogue wait for finalize
+        try:
+            tf = self._open(path)
+            refs = self.refs[path]
+            # Each table block is assembled in memory and written with a single call
+            parts = ['\t', schema_name, ':']
+            append = parts.append
+            if sc.description:
+                append(f"- {sc.description}")
+            append('\n')
+            for at, dt in zip(sc.attributes, pd.dtypes.values):
+                append(f"\t\t- {at.name}:{dt.kind}")
+                if at.description:
+                    append(f" - {at.description}")
+                append("\n")
+                if at.type=="${ref}":
+                    refs.append({'p': at.params.dataset, 'pa':at.params.attribute,'c' : schema_name, 'ca': at.name, 'cord': (at.params.cord or "1-*")})
+            append("\n")
+            tf.write("".join(parts))
+        except BaseException:
+            self._close_all()
+            raise
 
-            epilog = self.write_params.get('epilogue')
-            if epilog:
-                tf.write(epilog)
+    def finalize_writer(self):
+        rules = self.write_params.get('rules')
+        epilog = self.write_params.get('epilogue')
+        try:
+            for path, tf in self._files.items():
+                parts = ["Relations:\n"]
+                append = parts.append
+                for r in self.refs[path]:
+                    append('\t' + r['p']+'.'+r['pa'] +f" -({r['cord']})-" + r['c']+'.'+r['ca']+'\n')
 
-            tf.close()
+                if (rules):
+                    append("\nRules:\n")
+                    if (isinstance(rules, str)):
+                        append(f"{rules}\n")
+                    if (isinstance(rules, list)):
+                        for v in rules:
+                            formated = str(v).replace('\n', '\n\t\t ')
+                            append(f"\t -{formated}\n")
 
+                if epilog:
+                    append(epilog)
 
+                tf.write("".join(parts))
+        finally:
+            self._close_all()
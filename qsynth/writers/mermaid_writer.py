@@ -8,40 +8,53 @@ from qsynth.writers import register_writer
 class ErMermaidModelWriter(Writer):
 
     def __init__(self):
-        self.last_path = None
-        self.refs = []
-        self.models = {}
+        # Open output files by path with the relations to emit when finalizing
+        self._files = {}
+        self.refs = {}
 
     def init_writer(self, init_path):
         pass
 
-    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        self.last_path = path
-        sc = [schema for schema in model.model.schemas if schema.name == schema_name][0]
-        names = [x.name for x in sc.attributes]
-        types = [str(x.kind) for x in list(pd.dtypes)]
-        a = list(zip(names, types))
-        for at in sc.attributes:
-            if at.type=="${ref}":
-                self.refs.append({'p': at.params.dataset, 'pa':at.params.attribute,'c' : schema_name, 'ca': at.name, 'cord': (at.params.cord or "1-*")})
-        self.models.update({schema_name:a})
-
-    def finalize_writer(self):
-        Writer.ensure_path(self.last_path)
-        with (open(self.last_path, "w") as tf):
+    def _open(self, path):
+        tf = self._files.get(path)
+        if tf is None:
+            self._ensure_path(path)
+            tf = self._files[path] = open(path, "w", buffering=1 << 20)
+            self.refs[path] = []
             tf.write("erDiagram\n")
-            for k,v in self.models.items():
-                tf.write(k +' {\n')
-                for a in v:
-                    typename = Writer.clean_type_name(a[1])
-                    tf.write(f"\t{typename} {a[0]}\n")
-                tf.write("}\n")
-            for r in self.refs:
-                tf.write(''+r['p']+' ')
-                c = r['cord'].replace('1','||').replace('-','--').replace('*','o{')
-
-                tf.write(f" {c}")
-                tf.write(' '+r['c']+':has\n')
+        return tf
+
+    def _close_all(self):
+        for tf in self._files.values():
             tf.close()
+        self._files.clear()
+        self.refs.clear()
 
+    def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
+        sc = model.schemas_by_name[schema_name]
+        # Entities are written as they arrive; only relations wait for finalize
+        try:
+            tf = self._open(path)
+            refs = self.refs[path]
+            tf.write(schema_name + ' {\n')
+            for at, dt in zip(sc.attributes, pd.dtypes.values):
+                typename = Writer.clean_type_name(dt.kind)
+                tf.write(f"\t{typename} {at.name}\n")
+                if at.type=="${ref}":
+                    refs.append({'p': at.params.dataset, 'pa':at.params.attribute,'c' : schema_name, 'ca': at.name, 'cord': (at.params.cord or "1-*")})
+            tf.write("}\n")
+        except BaseException:
+            self._close_all()
+            raise
 
+    def finalize_writer(self):
+        try:
+            for path, tf in self._files.items():
+                for r in self.refs[path]:
+                    tf.write(''+r['p']+' ')
+                    c = r['cord'].replace('1','||').replace('-','--').replace('*','o{')
+
+                    tf.write(f" {c}")
+                    tf.write(' '+r['c']+':has\n')
+        finally:
+            self._close_all()
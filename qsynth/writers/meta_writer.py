@@ -4,6 +4,12 @@ from pandas import DataFrame
 from qsynth.writers.base import Writer
 from qsynth.writers import register_writer
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 
 @register_writer('meta')
 class MetaDescriptorWriter(Writer):
@@ -21,15 +27,9 @@ class MetaDescriptorWriter(Writer):
         self.last_path = path
         self.model_name = model_name
         self.write_params.update(writeparams)
-        sc = [schema for schema in model.model.schemas if schema.name == schema_name][0]
-        names = [x.name for x in sc.attributes]
-        types = [Writer.to_sql_type(x.kind) for x in list(pd.dtypes)] if hasattr(Writer, 'to_sql_type') else [str(x.kind) for x in list(pd.dtypes)]
-        descriptions = [x.description for x in sc.attributes]
-        a = list(zip(names, types, descriptions))
-        attrs = []
-        for o in a:
-            da = {"name": o[0], "type":str(o[1]).lower(), "description": o[2]}
-            attrs.append(da)
+        sc = model.schemas_by_name[schema_name]
+        attrs = [{"name": at.name, "type": Writer.to_sql_type(dt.kind).lower(), "description": at.description}
+                 for at, dt in zip(sc.attributes, pd.dtypes.values)]
         self.tables.append({"name":schema_name, "attributes" : attrs})
 
         for at in sc.attributes:
@@ -38,9 +38,9 @@ class MetaDescriptorWriter(Writer):
                     self.refs.append({"parent": {"table" : at.params.dataset, "attribute" : at.params.attribute }, 'child': {"table" : schema_name, 'attribute': at.name}, "cardinality" : (at.params.cord or "1-*")})
 
     def finalize_writer(self):
-        Writer.ensure_path(self.last_path)
+        self._ensure_path(self.last_path)
         fm = {"schemas" : [{"name": self.model_name, "tables": self.tables, "references": self.refs}] }
         with (open(self.last_path, "w") as tf):
-            yaml.dump(fm, tf, default_flow_style=False, sort_keys=False)
+            yaml.dump(fm, tf, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
 
 
@@ -1,16 +1,27 @@
 from pandas import DataFrame
 
-from qsynth.writers.base import Writer
+from qsynth.writers.base import DEFAULT_WRITE_BUFFER_SIZE, Writer
 from qsynth.writers import register_writer
 
 
 @register_writer('parquet')
 class ParquetWriter(Writer):
+    thread_safe = True
+
     def init_writer(self, init_path):
         print(f"Init Parquet writer on {init_path}")
 
     def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        Writer.ensure_path(path)
-        pd.to_parquet(path, **writeparams)
+        self._ensure_path(path)
+        params = dict(writeparams)
+        buffer_size = params.pop('write_buffer_size', DEFAULT_WRITE_BUFFER_SIZE)
+        if 'partition_cols' in params or params.get('engine', 'auto') not in ('auto', 'pyarrow'):
+            # Partitioned datasets are directories, and other engines need a path: pandas writes them
+            pd.to_parquet(path, **params)
+            return
+        import pyarrow as pa
+        # Arrow-native buffered file sink: pages are flushed to disk in buffer_size chunks
+        with pa.output_stream(str(path), compression=None, buffer_size=buffer_size) as sink:
+            pd.to_parquet(sink, **params)
 
 
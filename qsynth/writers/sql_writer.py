@@ -5,70 +5,91 @@ from qsynth.writers import register_writer
 from qsynth.models import Schema
 
 
+def _sql_quote(s):
+    """Quote a string as a SQL literal, doubling embedded quotes."""
+    return "'" + s.replace("'", "''") + "'"
+
+
+def _quoted_column(col):
+    return list(map(_sql_quote, col.astype(str).tolist()))
+
+
+def _date_column(col):
+    return col.dt.strftime("'%Y-%m-%d'").where(col.notna(), 'NULL').tolist()
+
+
+def _plain_column(col):
+    return col.astype(str).tolist()
+
+
+# Column encoders by dtype kind; numeric and other kinds render unquoted
+_FORMATTERS = {
+    'O': _quoted_column,
+    'M': _date_column,
+}
+
+
 @register_writer('sql')
 class SqlWriter(Writer):
+    # Rows per multi-row INSERT statement
+    INSERT_BATCH_SIZE = 1000
+
     def __init__(self):
-        self.last_path = None
-        self.lines = []
+        # Open output files by path; statements are streamed as they are produced
+        self._files = {}
 
     def init_writer(self, init_path):
         print(f"Init SQL writer on {init_path}")
 
-    @staticmethod
-    def to_sql_type(dk):
-        match dk:
-            case 'i':
-                return 'INT'
-            case 'O':
-                return 'VARCHAR'
-            case 'f':
-                return 'DECIMAL(15,4)'
-            case 'M':
-                return 'DATE'
-            case _:
-                raise Exception(f"Unknown type kind {dk}")
-
     def _get_columns_definition(dataset_schema: Schema, pd):
         attrs = []
 
-        for tp, x in list(zip(list(pd.dtypes), dataset_schema.attributes)):
-            attrs.append(f"{x.name} {SqlWriter.to_sql_type(tp.kind)} NOT NULL\n")
+        for (_, col), x in zip(pd.items(), dataset_schema.attributes):
+            kind = col.dtype.kind
+            # Missing dates are written as NULL, so their columns must accept it
+            null = "NULL" if kind == 'M' and col.hasnans else "NOT NULL"
+            attrs.append(f"{x.name} {Writer.to_sql_type(kind)} {null}\n")
         return "\t "+ "\t,".join(attrs)
 
-    def _write_insert(self, dataset_schema: Schema, pd, row):
+    def _write_inserts(self, dataset_schema: Schema, pd, batch_size):
         attrs = ",".join([x.name for x in dataset_schema.attributes])
-
-        type = [ x.kind for x in list(pd.dtypes)]
-        values = list(zip(type, list(row)))
-
-        def encode(k,o):
-            match k:
-                case 'O':
-                    return "'" + str(o).replace("'", "''") + "'"
-                case _ :
-                    return str(o)
-
-        enc = ",".join([encode(x[0],x[1]) for x in values])
-        return f"INSERT INTO {dataset_schema.name} ({attrs}) VALUES ({enc});"
+        # Escaping and formatting run per column; rows are only assembled by joining
+        formatters = [_FORMATTERS.get(dt.kind, _plain_column) for dt in pd.dtypes.values]
+        cols = [fmt(col) for fmt, (_, col) in zip(formatters, pd.items())]
+        rows = ["(" + ",".join(row) + ")" for row in zip(*cols)]
+        header = f"INSERT INTO {dataset_schema.name} ({attrs}) VALUES\n"
+        return [header + ",\n".join(rows[i:i + batch_size]) + ";"
+                for i in range(0, len(rows), batch_size)]
+
+    def _open(self, path):
+        tf = self._files.get(path)
+        if tf is None:
+            self._ensure_path(path)
+            tf = self._files[path] = open(path, "w", buffering=1 << 20)
+        return tf
 
     def write(self, path, pd: DataFrame, model_name, schema_name, model, writeparams={}):
-        self.last_path = path
-        sc = [schema for schema in model.model.schemas if schema.name == schema_name]
-        if not sc or len(sc) == 0:
+        dataset_schema = model.schemas_by_name.get(schema_name)
+        if dataset_schema is None:
             return
-        dataset_schema = sc[0]
-        self.lines.append(f"//=========== {model_name} {schema_name} ==========")
-        self.lines.append(f"DROP TABLE IF EXISTS {schema_name};")
-
-        self.lines.append(f"CREATE TABLE {schema_name} (")
-        self.lines.append(SqlWriter._get_columns_definition(dataset_schema, pd))
-        self.lines.append(f");")
-        for index, row in pd.iterrows():
-            self.lines.append(self._write_insert(dataset_schema, pd, row))
+        batch_size = writeparams.get('batch_size', SqlWriter.INSERT_BATCH_SIZE)
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}")
+        tf = self._open(path)
+        tf.write(f"//=========== {model_name} {schema_name} ==========\n")
+        tf.write(f"DROP TABLE IF EXISTS {schema_name};\n")
+
+        tf.write(f"CREATE TABLE {schema_name} (\n")
+        tf.write(SqlWriter._get_columns_definition(dataset_schema, pd) + "\n")
+        tf.write(");\n")
+        if len(pd.columns):
+            for statement in self._write_inserts(dataset_schema, pd, batch_size):
+                tf.write(statement)
+                tf.write("\n")
 
     def finalize_writer(self):
-        Writer.ensure_path(self.last_path)
-        with open(self.last_path, "w") as tf:
-            tf.write("\n".join(self.lines))
+        for tf in self._files.values():
+            tf.close()
+        self._files.clear()
 
 